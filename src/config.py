@@ -73,6 +73,7 @@ class Config:
         4: 11,  # Points per game for 4-team pools
         5: 9,   # Points per game for 5-team pools
     }
+    DEFAULT_POOL_POINTS = 9  # Any other pool size (e.g. one pool of 6-7 teams)
 
 
 def load_config(base_path: Optional[Path] = None) -> Config:
@@ -219,13 +220,11 @@ def load_user_info_partial(base_path: Optional[Path] = None) -> Optional[Partial
 
     user_info_file = base_path / "config" / USER_INFO_FILE
 
-    if not user_info_file.exists():
+    try:
+        data = json.loads(user_info_file.read_text())
+    except FileNotFoundError:
         debug_log(f"User info file not found: {user_info_file}")
         return None
-
-    try:
-        with open(user_info_file) as f:
-            data = json.load(f)
     except json.JSONDecodeError as e:
         raise UserInfoError(f"Invalid JSON in {USER_INFO_FILE}: {e}")
 
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 from .config import debug_log
 
@@ -26,17 +26,48 @@ class Team:
         return (self.player1, self.player2)
 
 
+def _parse_ladder_lines(lines: Iterable[str]) -> List[str]:
+    """Parse DUPR Ladder player names from an iterable of lines."""
+    players = []
+    for line in lines:
+        name = line.strip()
+        if name:
+            players.append(name)
+    return players
+
+
+def _parse_team_lines(lines: Iterable[str]) -> List[Team]:
+    """Parse Partner DUPR "Player1 / Player2" teams from an iterable of lines."""
+    teams = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        player1, sep, player2 = line.partition("/")
+        if not sep:
+            debug_log(f"Skipping invalid team line: {line}")
+            continue
+
+        if "/" in player2:
+            debug_log(f"Skipping malformed team line: {line}")
+            continue
+
+        player1 = player1.strip()
+        player2 = player2.strip()
+
+        if player1 and player2:
+            teams.append(Team(player1=player1, player2=player2))
+    return teams
+
+
 def parse_dupr_ladder_players(file_path: Path) -> List[str]:
     """
     Parse player list for DUPR Ladder format.
     One player name per line.
     """
-    players = []
     with open(file_path) as f:
-        for line in f:
-            name = line.strip()
-            if name:
-                players.append(name)
+        players = _parse_ladder_lines(f)
 
     debug_log(f"Parsed {len(players)} players from {file_path}")
     return players
@@ -47,27 +78,8 @@ def parse_partner_dupr_teams(file_path: Path) -> List[Team]:
     Parse player list for Partner DUPR format.
     Format: "Player1 / Player2" per line.
     """
-    teams = []
     with open(file_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            if "/" not in line:
-                debug_log(f"Skipping invalid team line: {line}")
-                continue
-
-            parts = line.split("/")
-            if len(parts) != 2:
-                debug_log(f"Skipping malformed team line: {line}")
-                continue
-
-            player1 = parts[0].strip()
-            player2 = parts[1].strip()
-
-            if player1 and player2:
-                teams.append(Team(player1=player1, player2=player2))
+        teams = _parse_team_lines(f)
 
     debug_log(f"Parsed {len(teams)} teams from {file_path}")
     return teams
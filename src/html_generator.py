@@ -1,8 +1,11 @@
 """HTML output generator using Bootstrap 5 with modern design."""
 
+import functools
 import math
+import string
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional
 from pathlib import Path
 
@@ -10,10 +13,36 @@ from .player_search import SearchResult
 from .game_types import Team, calculate_team_rating
 from .config import Config
 
+# Pool names in order: 'A', 'B', 'C', ...
+_POOL_NAMES = string.ascii_uppercase
 
-@dataclass
-class PlayerWithRating:
+# Sort keys for _sort_desc
+_BY_RATING = attrgetter("rating")
+_BY_TEAM_RATING = attrgetter("team_rating")
+
+
+class _FrozenSlotsState:
+    """Copy/pickle support for frozen dataclasses with hand-written __slots__.
+
+    Frozen dataclasses reject setattr, which copy/pickle use to restore slot
+    state; slots=True generates the equivalent of these on 3.10+.
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class PlayerWithRating(_FrozenSlotsState):
     """Player with resolved rating information."""
+    # Explicit __slots__ rather than dataclass(slots=True), which needs 3.10+
+    __slots__ = ("name", "rating", "profile_url", "found", "search_method")
+
     name: str
     rating: float
     profile_url: Optional[str]
@@ -21,9 +50,11 @@ class PlayerWithRating:
     search_method: str
 
 
-@dataclass
-class TeamWithRatings:
+@dataclass(frozen=True)
+class TeamWithRatings(_FrozenSlotsState):
     """Team with resolved rating information."""
+    __slots__ = ("player1", "player2", "team_rating")
+
     player1: PlayerWithRating
     player2: PlayerWithRating
     team_rating: float
@@ -54,6 +85,21 @@ class PlayerPool:
         return len(self.players)
 
 
+def _sort_desc(items: list, key) -> list:
+    """Sort items highest-first by key, skipping the sort if already in order."""
+    keys = list(map(key, items))
+    if all(a >= b for a, b in zip(keys, keys[1:])):
+        return list(items)
+    # Sort indices by the keys already computed rather than calling key again
+    order = sorted(range(len(items)), key=keys.__getitem__, reverse=True)
+    return [items[i] for i in order]
+
+
+def _pool_name(index: int) -> str:
+    """Letter name for the pool at index, falling back to its number past 'Z'."""
+    return _POOL_NAMES[index] if index < len(_POOL_NAMES) else str(index + 1)
+
+
 def distribute_players_to_pools(
     players: List[PlayerWithRating],
     target_size: int = 5,
@@ -83,7 +129,7 @@ def distribute_players_to_pools(
     if not players:
         return []
     
-    sorted_players = sorted(players, key=lambda p: p.rating, reverse=True)
+    sorted_players = _sort_desc(players, key=_BY_RATING)
     N = len(sorted_players)
     
     # Edge case: fewer than min_size
@@ -103,7 +149,7 @@ def distribute_players_to_pools(
     player_index = 0
     
     for i in range(num_pools):
-        pool_name = chr(65 + i)  # 'A', 'B', 'C', 'D'...
+        pool_name = _pool_name(i)
         
         # Pools at END (lower rated) get extra players
         if i >= num_pools - remainder:
@@ -147,7 +193,7 @@ def distribute_players_to_picklebros_pools(
         return []
 
     # Sort players by rating (highest first)
-    sorted_players = sorted(players, key=lambda p: p.rating, reverse=True)
+    sorted_players = _sort_desc(players, key=_BY_RATING)
     N = len(sorted_players)
 
     # Calculate number of pools (player count should be validated before calling)
@@ -157,7 +203,7 @@ def distribute_players_to_picklebros_pools(
     player_index = 0
 
     for i in range(num_pools):
-        pool_name = chr(65 + i)  # 'A', 'B', 'C', 'D'...
+        pool_name = _pool_name(i)
         pool_players = sorted_players[player_index:player_index + 4]
         player_index += 4
         pools.append(PlayerPool(name=pool_name, players=pool_players))
@@ -198,7 +244,7 @@ def distribute_teams_to_pools(
         return []
 
     # Sort teams by rating (highest first)
-    sorted_teams = sorted(teams, key=lambda t: t.team_rating, reverse=True)
+    sorted_teams = _sort_desc(teams, key=_BY_TEAM_RATING)
     total_teams = len(sorted_teams)
 
     # Calculate number of pools
@@ -229,10 +275,10 @@ def distribute_teams_to_pools(
         team_index += pool_size
 
         # Pool name (A, B, C, etc.)
-        pool_name = chr(65 + i)  # 65 = 'A'
+        pool_name = _pool_name(i)
 
         # Points per game based on pool size
-        points = points_by_size.get(pool_size, 9)  # Default to 9
+        points = points_by_size.get(pool_size, Config.DEFAULT_POOL_POINTS)
 
         pool = Pool(
             name=pool_name,
@@ -274,6 +320,7 @@ def _get_team_rating_tier(team_rating: float) -> str:
         return "tier-low"
 
 
+@functools.lru_cache(maxsize=None)
 def _html_header(title: str, game_type: str) -> str:
     """Generate HTML header with Bootstrap and custom styles."""
     return f'''<!DOCTYPE html>
@@ -890,6 +937,24 @@ def _html_header(title: str, game_type: str) -> str:
 '''
 
 
+def _pool_column_class(num_pools: int) -> str:
+    """Determine Bootstrap column classes based on number of pools."""
+    if num_pools == 1:
+        return "col-12"
+    elif num_pools == 3:
+        return "col-12 col-md-6 col-lg-4"
+    else:  # 2 pools side by side, 4+ pools as a 2x2 grid
+        return "col-12 col-md-6"
+
+
+def _pool_style_class(pool_name: str) -> str:
+    """Determine pool header style class (A-D have their own colors)."""
+    pool_lower = pool_name.lower()
+    if pool_lower in ['a', 'b', 'c', 'd']:
+        return f"pool-{pool_lower}"
+    return "pool-default"
+
+
 def _html_footer() -> str:
     """Generate HTML footer."""
     return '''
@@ -924,26 +989,26 @@ def _resolution_summary(total: int, resolved: int, unresolved_players: List[str]
     status_class = "summary-success" if resolved == total else "summary-warning"
     status_icon = "bi-check-circle-fill text-success" if resolved == total else "bi-exclamation-triangle-fill text-warning"
 
-    html = f'''
+    parts = [f'''
         <div class="summary-card {status_class}">
             <div class="d-flex align-items-center">
                 <i class="bi {status_icon} me-2"></i>
                 <span><strong>Players resolved:</strong> {resolved}/{total}</span>
             </div>
-    '''
+    ''']
 
     if unresolved_players:
-        html += '''
+        parts.append('''
             <div class="unresolved-list">
                 <strong style="color: #92400e; font-size: 0.85rem;">Using default rating (2.5):</strong>
                 <ul class="mt-1">
-        '''
+        ''')
         for name in unresolved_players:
-            html += f'<li>{name}</li>'
-        html += '</ul></div>'
+            parts.append(f'<li>{name}</li>')
+        parts.append('</ul></div>')
 
-    html += '</div>'
-    return html
+    parts.append('</div>')
+    return "".join(parts)
 
 
 def generate_dupr_ladder_html(
@@ -958,54 +1023,40 @@ def generate_dupr_ladder_html(
     # Distribute players into pools
     pools = distribute_players_to_pools(players)
 
-    resolved = sum(1 for p in players if p.found)
     unresolved = [p.name for p in players if not p.found]
+    resolved = len(players) - len(unresolved)
 
-    html = _html_header("DUPR Ladder Rankings", "ladder")
+    parts = [_html_header("DUPR Ladder Rankings", "ladder")]
 
     # Page header
     date_str = datetime.now().strftime("%B %d, %Y")
-    html += f'''
+    parts.append(f'''
         <div class="mb-4">
             <h1 class="page-title">DUPR Ladder</h1>
             <p class="page-subtitle">{date_str}</p>
         </div>
-    '''
+    ''')
 
-    html += _resolution_summary(len(players), resolved, unresolved)
+    parts.append(_resolution_summary(len(players), resolved, unresolved))
 
-    # Determine column class based on number of pools
-    num_pools = len(pools)
-    if num_pools == 1:
-        col_class = "col-12"
-    elif num_pools == 2:
-        col_class = "col-12 col-md-6"
-    elif num_pools == 3:
-        col_class = "col-12 col-md-6 col-lg-4"
-    else:  # 4+ pools - 2x2 grid
-        col_class = "col-12 col-md-6"
+    col_class = _pool_column_class(len(pools))
 
-    html += '<div class="row">'
+    parts.append('<div class="row">')
 
     for pool in pools:
-        # Determine pool header style
-        pool_lower = pool.name.lower()
-        if pool_lower in ['a', 'b', 'c', 'd']:
-            pool_style_class = f"pool-{pool_lower}"
-        else:
-            pool_style_class = "pool-default"
+        pool_style_class = _pool_style_class(pool.name)
 
-        html += f'''
+        parts.append(f'''
         <div class="{col_class} mb-4">
             <div class="pool-card">
                 <div class="pool-header {pool_style_class}">
                     <span class="pool-name">POOL {pool.name}</span>
                     <span class="pool-meta">({pool.player_count} players)</span>
                 </div>
-        '''
+        ''')
         for rank, player in enumerate(pool.players, 1):
             unresolved_class = " unresolved" if not player.found else ""
-            html += f'''
+            parts.append(f'''
                 <div class="ladder-row{unresolved_class}">
                     <span class="rank-badge">{rank}</span>
                     <div class="flex-grow-1">
@@ -1013,18 +1064,18 @@ def generate_dupr_ladder_html(
                     </div>
                     {_rating_badge(player.rating, player.found)}
                 </div>
-            '''
-        html += '''
+            ''')
+        parts.append('''
             </div>
         </div>
-        '''
+        ''')
 
-    html += '</div>'
-
-    html += _html_footer()
+    parts.append('</div>')
+    parts.append(_html_footer())
+    html = "".join(parts)
 
     if output_path:
-        output_path.write_text(html)
+        output_path.write_bytes(html.encode("utf-8"))
 
     return html
 
@@ -1040,54 +1091,40 @@ def generate_picklebros_monday_html(
     # Distribute players into fixed 4-player pools
     pools = distribute_players_to_picklebros_pools(players)
 
-    resolved = sum(1 for p in players if p.found)
     unresolved = [p.name for p in players if not p.found]
+    resolved = len(players) - len(unresolved)
 
-    html = _html_header("PickleBros Monday", "picklebros")
+    parts = [_html_header("PickleBros Monday", "picklebros")]
 
     # Page header
     date_str = datetime.now().strftime("%B %d, %Y")
-    html += f'''
+    parts.append(f'''
         <div class="mb-4">
             <h1 class="page-title">PickleBros Monday</h1>
             <p class="page-subtitle">{date_str} | Fixed 4-Player Pools</p>
         </div>
-    '''
+    ''')
 
-    html += _resolution_summary(len(players), resolved, unresolved)
+    parts.append(_resolution_summary(len(players), resolved, unresolved))
 
-    # Determine column class based on number of pools
-    num_pools = len(pools)
-    if num_pools == 1:
-        col_class = "col-12"
-    elif num_pools == 2:
-        col_class = "col-12 col-md-6"
-    elif num_pools == 3:
-        col_class = "col-12 col-md-6 col-lg-4"
-    else:  # 4+ pools - 2x2 grid
-        col_class = "col-12 col-md-6"
+    col_class = _pool_column_class(len(pools))
 
-    html += '<div class="row">'
+    parts.append('<div class="row">')
 
     for pool in pools:
-        # Determine pool header style
-        pool_lower = pool.name.lower()
-        if pool_lower in ['a', 'b', 'c', 'd']:
-            pool_style_class = f"pool-{pool_lower}"
-        else:
-            pool_style_class = "pool-default"
+        pool_style_class = _pool_style_class(pool.name)
 
-        html += f'''
+        parts.append(f'''
         <div class="{col_class} mb-4">
             <div class="pool-card">
                 <div class="pool-header {pool_style_class}">
                     <span class="pool-name">POOL {pool.name}</span>
                     <span class="pool-meta">(4 players)</span>
                 </div>
-        '''
+        ''')
         for rank, player in enumerate(pool.players, 1):
             unresolved_class = " unresolved" if not player.found else ""
-            html += f'''
+            parts.append(f'''
                 <div class="ladder-row{unresolved_class}">
                     <span class="rank-badge">{rank}</span>
                     <div class="flex-grow-1">
@@ -1095,18 +1132,18 @@ def generate_picklebros_monday_html(
                     </div>
                     {_rating_badge(player.rating, player.found)}
                 </div>
-            '''
-        html += '''
+            ''')
+        parts.append('''
             </div>
         </div>
-        '''
-
-    html += '</div>'
+        ''')
 
-    html += _html_footer()
+    parts.append('</div>')
+    parts.append(_html_footer())
+    html = "".join(parts)
 
     if output_path:
-        output_path.write_text(html)
+        output_path.write_bytes(html.encode("utf-8"))
 
     return html
 
@@ -1128,18 +1165,16 @@ def generate_partner_dupr_html(
     total_teams = len(teams)
     total_pools = len(pools)
 
-    all_players = []
-    for team in teams:
-        all_players.extend([team.player1, team.player2])
+    all_players = [p for team in teams for p in (team.player1, team.player2)]
 
-    resolved = sum(1 for p in all_players if p.found)
     unresolved = [p.name for p in all_players if not p.found]
+    resolved = len(all_players) - len(unresolved)
 
-    html = _html_header("Partner DUPR", "partner")
+    parts = [_html_header("Partner DUPR", "partner")]
 
     # Page header with stats
     date_str = datetime.now().strftime("%B %d, %Y")
-    html += f'''
+    parts.append(f'''
         <div class="mb-4">
             <h1 class="page-title">Partner DUPR</h1>
             <p class="page-subtitle">{date_str}</p>
@@ -1149,16 +1184,15 @@ def generate_partner_dupr_html(
                 <span class="header-stat"><i class="bi bi-check-circle me-1"></i> {resolved}/{len(all_players)} players resolved</span>
             </div>
         </div>
-    '''
+    ''')
 
-    html += _resolution_summary(len(all_players), resolved, unresolved)
+    parts.append(_resolution_summary(len(all_players), resolved, unresolved))
 
     # Generate pool cards
     for pool in pools:
-        # Determine pool header class
-        pool_class = f"pool-{pool.name.lower()}" if pool.name.lower() in ['a', 'b', 'c', 'd'] else "pool-default"
+        pool_class = _pool_style_class(pool.name)
 
-        html += f'''
+        parts.append(f'''
         <div class="pool-card">
             <div class="pool-header {pool_class}">
                 <span class="pool-name">POOL {pool.name}</span>
@@ -1176,14 +1210,14 @@ def generate_partner_dupr_html(
                     </tr>
                 </thead>
                 <tbody>
-        '''
+        ''')
 
         for rank, team in enumerate(pool.teams, 1):
             p1 = team.player1
             p2 = team.player2
             team_tier = _get_team_rating_tier(team.team_rating)
 
-            html += f'''
+            parts.append(f'''
                     <tr class="team-row">
                         <td>
                             <div class="team-rank">{rank}</div>
@@ -1208,17 +1242,18 @@ def generate_partner_dupr_html(
                             <span class="team-dupr {team_tier}">{team.team_rating:.2f}</span>
                         </td>
                     </tr>
-            '''
+            ''')
 
-        html += '''
+        parts.append('''
                 </tbody>
             </table>
         </div>
-        '''
+        ''')
 
-    html += _html_footer()
+    parts.append(_html_footer())
+    html = "".join(parts)
 
     if output_path:
-        output_path.write_text(html)
+        output_path.write_bytes(html.encode("utf-8"))
 
     return html
@@ -2,12 +2,16 @@
 
 import sys
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from .config import debug_log
 from .game_types import GameType, Team
 
 
+# Read buffer for player list files
+_READ_BUFFER_SIZE = 64 * 1024
+
+
 class InputError(Exception):
     """Error during input parsing."""
     pass
@@ -41,6 +45,25 @@ def prompt_game_type() -> GameType:
             print("Invalid choice. Please enter 1, 2, or 3.")
 
 
+def _stdin_lines() -> Iterator[str]:
+    """
+    Yield lines from stdin.
+
+    A terminal is read with input(); piped input is iterated directly,
+    skipping input()'s per-call prompt handling.
+
+    Raises:
+        EOFError: At end of input, as input() does
+    """
+    if sys.stdin.isatty():
+        while True:
+            yield input()
+
+    for line in sys.stdin:
+        yield line.rstrip("\n")
+    raise EOFError
+
+
 def _read_player_list_once() -> List[str]:
     """
     Read player list from stdin once.
@@ -57,9 +80,7 @@ def _read_player_list_once() -> List[str]:
     lines = []
     empty_count = 0
 
-    while True:
-        line = input()
-
+    for line in _stdin_lines():
         if line.strip() == "":
             empty_count += 1
             if empty_count >= 1:  # Single empty line ends input
@@ -115,7 +136,7 @@ def parse_ladder_players_from_list(names: List[str]) -> List[str]:
     Returns:
         List[str]: Validated player names
     """
-    players = [name.strip() for name in names if name.strip()]
+    players = [name for name in map(str.strip, names) if name]
     debug_log(f"Parsed {len(players)} players for ladder")
     return players
 
@@ -132,11 +153,11 @@ def parse_partner_teams_from_list(names: List[str]) -> Tuple[List[Team], List[st
     Returns:
         Tuple[List[Team], List[str]]: Teams and any unpaired players
     """
-    players = [name.strip() for name in names if name.strip()]
-    teams = []
-
-    for i in range(0, len(players) - 1, 2):
-        teams.append(Team(player1=players[i], player2=players[i + 1]))
+    players = [name for name in map(str.strip, names) if name]
+    teams = [
+        Team(player1=player1, player2=player2)
+        for player1, player2 in zip(players[::2], players[1::2])
+    ]
 
     # Track unpaired player if odd number
     unpaired = [players[-1]] if len(players) % 2 == 1 else []
@@ -162,21 +183,29 @@ def parse_partner_teams_from_formatted_list(lines: List[str]) -> List[Team]:
         if not line:
             continue
 
-        if "/" in line:
-            # Formatted team line
-            parts = line.split("/")
-            if len(parts) == 2:
-                player1 = parts[0].strip()
-                player2 = parts[1].strip()
-                if player1 and player2:
-                    teams.append(Team(player1=player1, player2=player2))
-        else:
+        player1, sep, player2 = line.partition("/")
+        if not sep:
             debug_log(f"Skipping non-team line: {line}")
+            continue
+
+        if "/" in player2:
+            debug_log(f"Skipping malformed team line: {line}")
+            continue
+
+        player1 = player1.strip()
+        player2 = player2.strip()
+        if player1 and player2:
+            teams.append(Team(player1=player1, player2=player2))
 
     debug_log(f"Parsed {len(teams)} teams from formatted list")
     return teams
 
 
+def _read_player_lines(lines: Iterable[str]) -> List[str]:
+    """Strip each line once and drop blanks, streaming from any iterable of lines."""
+    return [line for line in map(str.strip, lines) if line]
+
+
 def read_players_from_file(file_path: Path) -> List[str]:
     """
     Read player names from a file.
@@ -190,12 +219,12 @@ def read_players_from_file(file_path: Path) -> List[str]:
     Raises:
         InputError: If file doesn't exist or is empty
     """
-    if not file_path.exists():
+    try:
+        with open(file_path, buffering=_READ_BUFFER_SIZE) as f:
+            lines = _read_player_lines(f)
+    except FileNotFoundError:
         raise InputError(f"File not found: {file_path}")
 
-    with open(file_path) as f:
-        lines = [line.strip() for line in f if line.strip()]
-
     if not lines:
         raise InputError(f"File is empty: {file_path}")
 
@@ -213,10 +242,7 @@ def detect_input_format(lines: List[str]) -> str:
     Returns:
         str: 'formatted_teams' if lines contain '/', else 'plain_names'
     """
-    for line in lines:
-        if "/" in line:
-            return "formatted_teams"
-    return "plain_names"
+    return "formatted_teams" if any("/" in line for line in lines) else "plain_names"
 
 
 def validate_picklebros_player_count(players: List[str]) -> None:
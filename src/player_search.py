@@ -1,11 +1,12 @@
 """Player search algorithm for finding DUPR ratings."""
 
-import re
+import functools
 import sys
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from operator import attrgetter
+from typing import Dict, Optional, List, Tuple
 
-from .config import Config, debug_log
+from .config import Config, PlayerOverride, debug_log
 from .dupr_client import DUPRClient, DUPRPlayer, DUPRAPIError, TokenExpiredError
 from .nickname_resolver import (
     NicknameResolver, get_resolver, are_names_equivalent, 
@@ -15,9 +16,12 @@ from .player_registry import PlayerRegistry, get_registry, save_registry, reset_
 from .interactive_confirm import prompt_player_selection, is_interactive
 
 
-@dataclass
+@dataclass(frozen=True)
 class SearchResult:
     """Result of a player search."""
+    # Explicit __slots__ rather than dataclass(slots=True), which needs 3.10+
+    __slots__ = ("name", "rating", "player_id", "profile_url", "found", "search_method")
+
     name: str
     rating: float
     player_id: Optional[int]
@@ -25,12 +29,82 @@ class SearchResult:
     found: bool
     search_method: str  # Describes how the player was found
 
+    # Frozen dataclasses reject setattr, which copy/pickle use to restore
+    # slot state; slots=True generates the equivalent of these on 3.10+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+# search_method labels, shared by every result found at that step
+_FULL_NAME_ALBERTA = "Full name + Alberta"
+_LAST_NAME_ALBERTA = "Last name + Alberta"
+_FULL_NAME_CANADA = "Full name + Canada"
+_LAST_NAME_CANADA = "Last name + Canada"
+_LAST_NAME_NO_FILTER = "Last name + No filter"
+_FULL_NAME_NO_FILTER = "Full name + No filter"
+_NOT_FOUND = "Default (player not found)"
+
+
+# Location filters, read from the config as (location_text, lat, lng)
+_ALBERTA = attrgetter("ALBERTA_TEXT", "ALBERTA_LAT", "ALBERTA_LNG")
+_CANADA = attrgetter("CANADA_TEXT", "CANADA_LAT", "CANADA_LNG")
+
+
+def _no_filter(config: Config) -> Tuple[None, None, None]:
+    """Location filter for a global search."""
+    return None, None, None
+
+
+# API search sequence as (query by last name?, location filter, search_method).
+# Last-name steps are skipped for short common last names and one-word names.
+_SEARCH_PLAN = (
+    (False, _ALBERTA, _FULL_NAME_ALBERTA),        # Primary search
+    (True, _ALBERTA, _LAST_NAME_ALBERTA),
+    (False, _CANADA, _FULL_NAME_CANADA),          # Players outside Alberta
+    (True, _CANADA, _LAST_NAME_CANADA),
+    (True, _no_filter, _LAST_NAME_NO_FILTER),     # Global search
+    (False, _no_filter, _FULL_NAME_NO_FILTER),    # Last resort for short last names
+)
+
 
 # Common short last names that need special handling (full name search preferred)
-SHORT_COMMON_LASTNAMES = {
+SHORT_COMMON_LASTNAMES = frozenset({
     'ng', 'hu', 'wu', 'li', 'le', 'lu', 'ma', 'xu', 'yu', 'ye', 'he', 'ho',
     'wong', 'chen', 'wang', 'zhang', 'liu', 'yang', 'huang', 'zhao', 'zhou', 'sun'
-}
+})
+
+
+# Guest markers that may also precede a name, e.g. "(G) Colin Ng"
+_GUEST_MARKERS = frozenset({'(g)', '(guest)'})
+
+
+@functools.lru_cache(maxsize=2048)
+def _strip_annotations(name: str) -> str:
+    """Strip a leading guest marker and trailing "(...)" groups; memoized for repeated roster names."""
+    cleaned = name.strip()
+    # Only guest markers are dropped from the front; other leading groups are kept
+    marker, sep, rest = cleaned.partition(')')
+    if sep and (marker + sep).lower() in _GUEST_MARKERS:
+        cleaned = rest.lstrip()
+    # Peel off trailing "(...)" groups, e.g. "John Doe (new) (G)", matching
+    # nested parentheses; an unbalanced group is left as entered
+    while cleaned.endswith(')'):
+        depth = 0
+        for open_idx in range(len(cleaned) - 1, -1, -1):
+            if cleaned[open_idx] == ')':
+                depth += 1
+            elif cleaned[open_idx] == '(':
+                depth -= 1
+                if depth == 0:
+                    break
+        else:
+            break
+        cleaned = cleaned[:open_idx].rstrip()
+    return cleaned
 
 
 class PlayerSearcher:
@@ -45,35 +119,42 @@ class PlayerSearcher:
         self.nickname_resolver = get_resolver()
         # Use provided registry or global instance
         self.player_registry = registry if registry is not None else get_registry()
+        # Overrides keyed by normalized name, snapshotted once for the session
+        self._overrides: Dict[str, PlayerOverride] = {
+            self._normalize_name(name): override
+            for name, override in config.overrides.items()
+        }
+        # Matches from the API search sequence (player, method), keyed by normalized cleaned name
+        self._search_cache: Dict[str, Tuple[DUPRPlayer, str]] = {}
 
     def _clean_name(self, name: str) -> str:
         """
         Clean player name by removing guest markers and other annotations.
 
-        Removes:
+        Removes trailing parenthetical annotations:
         - (G) or (g) - guest marker
         - (Guest) - full guest marker
-        - Trailing parenthetical annotations
+        - Any other note, e.g. (new)
+
+        A guest marker before the name, e.g. "(G) Colin Ng", is removed too.
         """
-        # Remove common guest markers
-        cleaned = re.sub(r'\s*\([Gg](uest)?\)\s*', '', name)
-        # Remove any other trailing parenthetical content
-        cleaned = re.sub(r'\s*\([^)]*\)\s*$', '', cleaned)
-        return cleaned.strip()
+        return _strip_annotations(name)
 
     def _normalize_name(self, name: str) -> str:
         """Normalize a name for comparison."""
         return name.lower().strip()
 
-    def _first_name_matches(self, search_first: str, api_first: str) -> bool:
+    def _first_name_matches(self, search_normalized: str, api_first: str) -> bool:
         """Check if the search first name matches the API first name.
         
         Uses a multi-tier matching approach:
         1. Substring matching (original behavior)
         2. Nickname equivalence (e.g., Nick = Nicholas)
         3. Fuzzy matching as fallback (threshold ~0.85)
+
+        The search name is normalized once by the caller, since it is
+        compared against every candidate in the result list.
         """
-        search_normalized = self._normalize_name(search_first)
         api_normalized = self._normalize_name(api_first)
         
         # Tier 1: Substring matching (original logic)
@@ -82,13 +163,13 @@ class PlayerSearcher:
         
         # Tier 2: Nickname equivalence
         if are_names_equivalent(search_normalized, api_normalized):
-            debug_log(f"Nickname match: '{search_first}' ~ '{api_first}'")
+            debug_log(f"Nickname match: '{search_normalized}' ~ '{api_first}'")
             return True
         
         # Tier 3: Fuzzy matching (for typos and variations)
         if fuzzy_match(search_normalized, api_normalized, self.FUZZY_THRESHOLD):
             score = get_fuzzy_score(search_normalized, api_normalized)
-            debug_log(f"Fuzzy match: '{search_first}' ~ '{api_first}' (score: {score:.2f})")
+            debug_log(f"Fuzzy match: '{search_normalized}' ~ '{api_first}' (score: {score:.2f})")
             return True
         
         return False
@@ -127,9 +208,10 @@ class PlayerSearcher:
             return self._resolve_ambiguous_matches(exact_matches, full_name)
 
         # Fallback: First name matching (for cases where full name doesn't exactly match)
+        first_name_normalized = self._normalize_name(first_name)
         matches = [
             p for p in players
-            if self._first_name_matches(first_name, p.first_name)
+            if self._first_name_matches(first_name_normalized, p.first_name)
         ]
 
         if len(matches) == 1:
@@ -244,13 +326,14 @@ class PlayerSearcher:
 
         match = self._find_unique_match(players, first_name, full_name)
         if match:
-            return match, f"{filter_desc}"
+            return match, filter_desc
 
         return None, ""
 
     def _is_short_common_lastname(self, name: str) -> bool:
         """Check if a name is a short common last name that needs special handling."""
-        return name.lower() in SHORT_COMMON_LASTNAMES
+        # Already-lowercase names hit without allocating a lowered copy
+        return name in SHORT_COMMON_LASTNAMES or name.lower() in SHORT_COMMON_LASTNAMES
 
     def search_player(self, full_name: str) -> SearchResult:
         """
@@ -259,12 +342,14 @@ class PlayerSearcher:
         Search sequence:
         1. Check player registry (cached matches)
         2. Check player_overrides.json (using original and cleaned names)
-        3. Full Name + Alberta filter
-        4. Last Name + Alberta filter (skip for very common short last names)
-        5. Full Name + Canada filter
-        6. Last Name + Canada filter
-        7. Last Name + No filter
-        8. Fallback to default rating
+        3. Reuse an earlier found result for the same cleaned name
+        4. Full Name + Alberta filter
+        5. Last Name + Alberta filter (skip for very common short last names)
+        6. Full Name + Canada filter
+        7. Last Name + Canada filter (skip for very common short last names)
+        8. Last Name + No filter (skip for very common short last names)
+        9. Full Name + No filter
+        10. Fallback to default rating
         """
         # Step 1: Check player registry for cached name mappings
         # Registry stores the mapping from informal name -> DUPR name
@@ -311,8 +396,8 @@ class PlayerSearcher:
         
         # Check override with original name first
         name_key = self._normalize_name(full_name)
-        if name_key in self.config.overrides:
-            override = self.config.overrides[name_key]
+        override = self._overrides.get(name_key)
+        if override is not None:
             debug_log(f"Using override for '{full_name}': {override.rating} ({override.reason})")
             return SearchResult(
                 name=full_name,
@@ -330,8 +415,8 @@ class PlayerSearcher:
 
         # Check override with cleaned name if different
         cleaned_key = self._normalize_name(cleaned_name)
-        if cleaned_key != name_key and cleaned_key in self.config.overrides:
-            override = self.config.overrides[cleaned_key]
+        override = self._overrides.get(cleaned_key) if cleaned_key != name_key else None
+        if override is not None:
             debug_log(f"Using override for cleaned name '{cleaned_name}': {override.rating} ({override.reason})")
             return SearchResult(
                 name=full_name,
@@ -342,6 +427,41 @@ class PlayerSearcher:
                 search_method=f"Override: {override.reason}"
             )
 
+        # Repeated roster names (e.g. "Colin Ng" and "colin ng (G)") share one search
+        # Going through _create_result still registers each variant under its own name
+        cached = self._search_cache.get(cleaned_key)
+        if cached is not None:
+            debug_log(f"Reusing search result for '{full_name}'")
+            return self._create_result(full_name, *cached)
+
+        match, method = self._search_dupr(full_name, cleaned_name)
+        if match is None:
+            # Step 10: Fallback
+            print(f"Warning: Player '{full_name}' not found, using default rating", file=sys.stderr)
+            return SearchResult(
+                name=full_name,
+                rating=self.config.DEFAULT_RATING,
+                player_id=None,
+                profile_url=None,
+                found=False,
+                search_method=_NOT_FOUND
+            )
+
+        # Misses aren't cached: an API error mid-search looks the same as no match
+        self._search_cache[cleaned_key] = (match, method)
+        return self._create_result(full_name, match, method)
+
+    def _search_dupr(self, full_name: str, cleaned_name: str) -> Tuple[Optional[DUPRPlayer], str]:
+        """
+        Run the DUPR API search sequence for a cleaned name.
+
+        Args:
+            full_name: Name as entered, used in log messages
+            cleaned_name: Name with annotations removed, used for the queries
+
+        Returns:
+            (player, search method) for the first unique match, or (None, "")
+        """
         # Parse cleaned name
         name_parts = cleaned_name.strip().split()
         first_name = name_parts[0] if name_parts else ""
@@ -352,88 +472,27 @@ class PlayerSearcher:
         if is_short_lastname:
             debug_log(f"Short common last name detected: '{last_name}'")
 
-        try:
-            # Step 2: Full Name + Alberta filter (primary search)
-            match, method = self._search_with_filter(
-                query=cleaned_name,
-                first_name=first_name,
-                full_name=cleaned_name,
-                location_text=self.config.ALBERTA_TEXT,
-                lat=self.config.ALBERTA_LAT,
-                lng=self.config.ALBERTA_LNG,
-                filter_desc="Full name + Alberta"
-            )
-            if match:
-                return self._create_result(full_name, match, method)
-
-            # Step 3: Last Name + Alberta filter
-            # Skip for very common short last names as they return too many results
-            if not is_short_lastname:
-                match, method = self._search_with_filter(
-                    query=last_name,
-                    first_name=first_name,
-                    full_name=cleaned_name,
-                    location_text=self.config.ALBERTA_TEXT,
-                    lat=self.config.ALBERTA_LAT,
-                    lng=self.config.ALBERTA_LNG,
-                    filter_desc="Last name + Alberta"
-                )
-                if match:
-                    return self._create_result(full_name, match, method)
-
-            # Step 4: Full Name + Canada filter (for players outside Alberta)
-            match, method = self._search_with_filter(
-                query=cleaned_name,
-                first_name=first_name,
-                full_name=cleaned_name,
-                location_text=self.config.CANADA_TEXT,
-                lat=self.config.CANADA_LAT,
-                lng=self.config.CANADA_LNG,
-                filter_desc="Full name + Canada"
-            )
-            if match:
-                return self._create_result(full_name, match, method)
-
-            # Step 5: Last Name + Canada filter
-            if not is_short_lastname:
-                match, method = self._search_with_filter(
-                    query=last_name,
-                    first_name=first_name,
-                    full_name=cleaned_name,
-                    location_text=self.config.CANADA_TEXT,
-                    lat=self.config.CANADA_LAT,
-                    lng=self.config.CANADA_LNG,
-                    filter_desc="Last name + Canada"
-                )
-                if match:
-                    return self._create_result(full_name, match, method)
+        # A single-word name's last-name queries repeat its full-name queries
+        # with the same filters, so their results are already in hand
+        skip_last_name = is_short_lastname or last_name == cleaned_name
 
-            # Step 6: Last Name + No filter (global search)
-            if not is_short_lastname:
+        try:
+            # Steps 4-9: walk _SEARCH_PLAN until a unique match
+            for by_last_name, location, filter_desc in _SEARCH_PLAN:
+                if by_last_name and skip_last_name:
+                    continue
+                location_text, lat, lng = location(self.config)
                 match, method = self._search_with_filter(
-                    query=last_name,
+                    query=last_name if by_last_name else cleaned_name,
                     first_name=first_name,
                     full_name=cleaned_name,
-                    location_text=None,
-                    lat=None,
-                    lng=None,
-                    filter_desc="Last name + No filter"
+                    location_text=location_text,
+                    lat=lat,
+                    lng=lng,
+                    filter_desc=filter_desc
                 )
                 if match:
-                    return self._create_result(full_name, match, method)
-
-            # Step 6b: Full Name + No filter (last resort for short last names)
-            match, method = self._search_with_filter(
-                query=cleaned_name,
-                first_name=first_name,
-                full_name=cleaned_name,
-                location_text=None,
-                lat=None,
-                lng=None,
-                filter_desc="Full name + No filter"
-            )
-            if match:
-                return self._create_result(full_name, match, method)
+                    return match, method
 
         except TokenExpiredError:
             # Re-raise token errors to halt execution
@@ -442,16 +501,7 @@ class PlayerSearcher:
         except DUPRAPIError as e:
             debug_log(f"API error searching for '{full_name}': {e}")
 
-        # Step 7: Fallback
-        print(f"Warning: Player '{full_name}' not found, using default rating", file=sys.stderr)
-        return SearchResult(
-            name=full_name,
-            rating=self.config.DEFAULT_RATING,
-            player_id=None,
-            profile_url=None,
-            found=False,
-            search_method="Default (player not found)"
-        )
+        return None, ""
 
     def _create_result(self, search_name: str, player: DUPRPlayer, method: str) -> SearchResult:
         """Create a SearchResult from a matched player and register in cache."""
@@ -0,0 +1,38 @@
+"""Shared pytest configuration for the test suite."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def ladder_file(tmp_path_factory):
+    """Canonical DUPR Ladder player list, written once per session."""
+    path = tmp_path_factory.mktemp("game_types") / "players.txt"
+    path.write_text("John Doe\nJane Smith\nBob Wilson\n")
+    return path
+
+
+@pytest.fixture(scope="session")
+def partner_file(tmp_path_factory):
+    """Canonical Partner DUPR team list, written once per session."""
+    path = tmp_path_factory.mktemp("game_types") / "teams.txt"
+    path.write_text("John Doe / Jane Smith\nBob Wilson / Alice Brown\n")
+    return path
+
+
+# Playwright: pytest-playwright opens a new browser context for every test.
+# Share one context across the session and hand each test its own page.
+
+@pytest.fixture(scope="session")
+def context(browser, browser_context_args):
+    """Browser context shared by all Playwright tests in the session."""
+    context = browser.new_context(**browser_context_args)
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def page(context):
+    """Fresh page per test inside the shared browser context."""
+    page = context.new_page()
+    yield page
+    page.close()
@@ -1,9 +1,9 @@
 """Tests for configuration module."""
 
 import json
+import re
 import pytest
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
 from src.config import (
@@ -13,111 +13,128 @@ from src.config import (
     load_user_info, load_user_info_partial, save_user_info,
     prompt_user_info_setup, ensure_user_info,
     prompt_for_name, prompt_for_rating,
-    MIN_RATING, MAX_RATING
+    MIN_RATING, MAX_RATING, USER_INFO_FILE
 )
 
+# Pre-serialized JSON fixtures (static content, no need to json.dumps per test)
+OVERRIDES_JSON = (
+    '{"overrides": ['
+    '{"name": "John Doe", "rating": 4.5, "reason": "Test override"}, '
+    '{"name": "Jane Smith", "rating": 3.0, "reason": "Another test"}]}'
+)
+OVERRIDES_JSON_UNNORMALIZED = (
+    '{"overrides": [{"name": "  JOHN DOE  ", "rating": 4.5, "reason": "Test"}]}'
+)
+USER_JSON = '{"name": "Ravi Kalluri", "rating": 3.93}'
+USER_JSON_WITH_REASON = '{"name": "Ravi Kalluri", "rating": 3.93, "reason": "Test reason"}'
+USER_JSON_NO_NAME = '{"rating": 3.93}'
+USER_JSON_NO_RATING = '{"name": "Ravi Kalluri"}'
+USER_JSON_INVALID_RATING = '{"name": "Ravi Kalluri", "rating": 1.5}'
+
+# Error-message patterns shared by the pytest.raises(match=...) checks
+_RE_MISSING_NAME = re.compile("Missing required fields.*name")
+_RE_MISSING_RATING = re.compile("Missing required fields.*rating")
+_RE_INVALID_JSON = re.compile("Invalid JSON")
+
+# Base path for in-memory tests; never touched on disk
+FAKE_BASE_PATH = Path("/nonexistent")
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Create an empty config directory under a fresh base path."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    return config_dir
+
+
+@pytest.fixture
+def fake_input(monkeypatch):
+    """Feed queued answers to builtins.input, ignoring the prompt."""
+    def _set(*answers: str) -> None:
+        queue = iter(answers)
+        monkeypatch.setattr("builtins.input", lambda _prompt="": next(queue))
+
+    return _set
 
+
+@pytest.fixture
+def fake_user_info(monkeypatch):
+    """Serve userInfo.json content from memory instead of the filesystem."""
+    real_read_text = Path.read_text
+
+    def _set(payload: str) -> None:
+        def read_text(self, *args, **kwargs):
+            if self.name == USER_INFO_FILE:
+                return payload
+            return real_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", read_text)
+
+    return _set
+
+
+@pytest.mark.io
 class TestLoadConfig:
     """Tests for load_config function."""
 
-    def test_loads_token_from_file(self):
+    def test_loads_token_from_file(self, config_dir):
         """Test that token is loaded from config file."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        base_path = config_dir.parent
 
-            # Create token file
-            token_file = config_dir / "dupr_token.txt"
-            token_file.write_text("test_token_123")
+        # Create token file
+        token_file = config_dir / "dupr_token.txt"
+        token_file.write_text("test_token_123")
 
-            config = load_config(base_path)
-            assert config.token == "test_token_123"
+        config = load_config(base_path)
+        assert config.token == "test_token_123"
 
-    def test_loads_player_overrides(self):
+    def test_loads_player_overrides(self, config_dir):
         """Test that player overrides are loaded correctly."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
-
-            # Create token file
-            (config_dir / "dupr_token.txt").write_text("test_token")
-
-            # Create overrides file
-            overrides_data = {
-                "overrides": [
-                    {
-                        "name": "John Doe",
-                        "rating": 4.5,
-                        "reason": "Test override"
-                    },
-                    {
-                        "name": "Jane Smith",
-                        "rating": 3.0,
-                        "reason": "Another test"
-                    }
-                ]
-            }
-            (config_dir / "player_overrides.json").write_text(
-                json.dumps(overrides_data)
-            )
-
-            config = load_config(base_path)
-
-            assert len(config.overrides) == 2
-            assert "john doe" in config.overrides
-            assert config.overrides["john doe"].rating == 4.5
-            assert "jane smith" in config.overrides
-
-    def test_raises_error_when_token_missing(self):
+        base_path = config_dir.parent
+
+        # Create token file
+        (config_dir / "dupr_token.txt").write_text("test_token")
+
+        # Create overrides file
+        (config_dir / "player_overrides.json").write_text(OVERRIDES_JSON)
+
+        config = load_config(base_path)
+
+        assert len(config.overrides) == 2
+        assert "john doe" in config.overrides
+        assert config.overrides["john doe"].rating == 4.5
+        assert "jane smith" in config.overrides
+
+    def test_raises_error_when_token_missing(self, tmp_path):
         """Test that FileNotFoundError is raised when token file is missing."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        base_path = tmp_path
 
-            with pytest.raises(FileNotFoundError):
-                load_config(base_path)
+        with pytest.raises(FileNotFoundError):
+            load_config(base_path)
 
-    def test_handles_missing_overrides_file(self):
+    def test_handles_missing_overrides_file(self, config_dir):
         """Test that missing overrides file is handled gracefully."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        base_path = config_dir.parent
 
-            (config_dir / "dupr_token.txt").write_text("test_token")
+        (config_dir / "dupr_token.txt").write_text("test_token")
 
-            config = load_config(base_path)
-            assert len(config.overrides) == 0
+        config = load_config(base_path)
+        assert len(config.overrides) == 0
 
-    def test_override_name_normalization(self):
+    def test_override_name_normalization(self, config_dir):
         """Test that override names are normalized (lowercase, trimmed)."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
-
-            (config_dir / "dupr_token.txt").write_text("test_token")
-
-            overrides_data = {
-                "overrides": [
-                    {
-                        "name": "  JOHN DOE  ",
-                        "rating": 4.5,
-                        "reason": "Test"
-                    }
-                ]
-            }
-            (config_dir / "player_overrides.json").write_text(
-                json.dumps(overrides_data)
-            )
-
-            config = load_config(base_path)
-            assert "john doe" in config.overrides
+        base_path = config_dir.parent
+
+        (config_dir / "dupr_token.txt").write_text("test_token")
+
+        (config_dir / "player_overrides.json").write_text(OVERRIDES_JSON_UNNORMALIZED)
+
+        config = load_config(base_path)
+        assert "john doe" in config.overrides
 
 
+@pytest.mark.unit
 class TestConfigConstants:
     """Tests for Config class constants."""
 
@@ -138,6 +155,7 @@ class TestConfigConstants:
         assert "search" in Config.API_URL
 
 
+@pytest.mark.unit
 class TestValidateRating:
     """Tests for rating validation."""
 
@@ -169,6 +187,7 @@ class TestValidateRating:
         assert validate_rating(str(MAX_RATING)) == MAX_RATING
 
 
+@pytest.mark.unit
 class TestValidateName:
     """Tests for name validation."""
 
@@ -191,215 +210,160 @@ class TestValidateName:
 class TestLoadUserInfo:
     """Tests for load_user_info function."""
 
-    def test_loads_valid_config(self):
+    @pytest.mark.io
+    def test_loads_valid_config(self, config_dir):
         """Test loading a valid user info file."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
-
-            user_data = {
-                "name": "Ravi Kalluri",
-                "rating": 3.93,
-                "reason": "Test reason"
-            }
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
-
-            user_info = load_user_info(base_path)
-
-            assert user_info is not None
-            assert user_info.name == "Ravi Kalluri"
-            assert user_info.rating == 3.93
-            assert user_info.reason == "Test reason"
-
-    def test_returns_none_when_file_missing(self):
+        base_path = config_dir.parent
+
+        (config_dir / "userInfo.json").write_text(USER_JSON_WITH_REASON)
+
+        user_info = load_user_info(base_path)
+
+        assert user_info is not None
+        assert user_info.name == "Ravi Kalluri"
+        assert user_info.rating == 3.93
+        assert user_info.reason == "Test reason"
+
+    @pytest.mark.io
+    def test_returns_none_when_file_missing(self, tmp_path):
         """Test that None is returned when file doesn't exist."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        base_path = tmp_path
 
-            user_info = load_user_info(base_path)
-            assert user_info is None
+        user_info = load_user_info(base_path)
+        assert user_info is None
 
-    def test_raises_on_invalid_json(self):
+    @pytest.mark.unit
+    def test_raises_on_invalid_json(self, fake_user_info):
         """Test that invalid JSON raises UserInfoError."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        fake_user_info("not valid json")
 
-            (config_dir / "userInfo.json").write_text("not valid json")
+        with pytest.raises(UserInfoError, match=_RE_INVALID_JSON):
+            load_user_info(FAKE_BASE_PATH)
 
-            with pytest.raises(UserInfoError, match="Invalid JSON"):
-                load_user_info(base_path)
-
-    def test_raises_on_missing_name(self):
+    @pytest.mark.unit
+    def test_raises_on_missing_name(self, fake_user_info):
         """Test that missing name field raises UserInfoError."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
-
-            user_data = {"rating": 3.93}
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
+        fake_user_info(USER_JSON_NO_NAME)
 
-            with pytest.raises(UserInfoError, match="Missing required fields.*name"):
-                load_user_info(base_path)
+        with pytest.raises(UserInfoError, match=_RE_MISSING_NAME):
+            load_user_info(FAKE_BASE_PATH)
 
-    def test_raises_on_missing_rating(self):
+    @pytest.mark.unit
+    def test_raises_on_missing_rating(self, fake_user_info):
         """Test that missing rating field raises UserInfoError."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
-
-            user_data = {"name": "Ravi Kalluri"}
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
+        fake_user_info(USER_JSON_NO_RATING)
 
-            with pytest.raises(UserInfoError, match="Missing required fields.*rating"):
-                load_user_info(base_path)
+        with pytest.raises(UserInfoError, match=_RE_MISSING_RATING):
+            load_user_info(FAKE_BASE_PATH)
 
-    def test_raises_on_invalid_rating(self):
+    @pytest.mark.unit
+    def test_raises_on_invalid_rating(self, fake_user_info):
         """Test that invalid rating (out of range) is treated as missing field."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        fake_user_info(USER_JSON_INVALID_RATING)
 
-            user_data = {"name": "Ravi Kalluri", "rating": 1.5}
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
+        # Invalid rating is now treated as a missing field
+        with pytest.raises(UserInfoError, match=_RE_MISSING_RATING):
+            load_user_info(FAKE_BASE_PATH)
 
-            # Invalid rating is now treated as a missing field
-            with pytest.raises(UserInfoError, match="Missing required fields.*rating"):
-                load_user_info(base_path)
-
-    def test_uses_default_reason(self):
+    @pytest.mark.unit
+    def test_uses_default_reason(self, fake_user_info):
         """Test that default reason is used when not specified."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
-
-            user_data = {"name": "Ravi Kalluri", "rating": 3.93}
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
+        fake_user_info(USER_JSON)
 
-            user_info = load_user_info(base_path)
-            assert "DUPR" in user_info.reason
+        user_info = load_user_info(FAKE_BASE_PATH)
+        assert "DUPR" in user_info.reason
 
 
+@pytest.mark.io
 class TestSaveUserInfo:
     """Tests for save_user_info function."""
 
-    def test_saves_user_info(self):
+    def test_saves_user_info(self, tmp_path):
         """Test that user info is saved correctly."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
+        base_path = tmp_path
 
-            user_info = UserInfo(name="Ravi Kalluri", rating=3.93, reason="Test")
-            save_user_info(user_info, base_path)
+        user_info = UserInfo(name="Ravi Kalluri", rating=3.93, reason="Test")
+        save_user_info(user_info, base_path)
 
-            # Read back and verify
-            user_info_file = base_path / "config" / "userInfo.json"
-            assert user_info_file.exists()
+        # Read back and verify (read_bytes raises if the file wasn't written)
+        user_info_file = base_path / "config" / "userInfo.json"
+        data = json.loads(user_info_file.read_bytes())
 
-            with open(user_info_file) as f:
-                data = json.load(f)
+        assert data["name"] == "Ravi Kalluri"
+        assert data["rating"] == 3.93
+        assert data["reason"] == "Test"
 
-            assert data["name"] == "Ravi Kalluri"
-            assert data["rating"] == 3.93
-            assert data["reason"] == "Test"
-
-    def test_creates_config_directory(self):
+    def test_creates_config_directory(self, tmp_path):
         """Test that config directory is created if missing."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            # config directory doesn't exist
+        base_path = tmp_path
+        # config directory doesn't exist
 
-            user_info = UserInfo(name="Ravi Kalluri", rating=3.93)
-            save_user_info(user_info, base_path)
+        user_info = UserInfo(name="Ravi Kalluri", rating=3.93)
+        save_user_info(user_info, base_path)
 
-            assert (base_path / "config").exists()
-            assert (base_path / "config" / "userInfo.json").exists()
+        # Reading the file back proves both the directory and file exist
+        data = json.loads((base_path / "config" / "userInfo.json").read_bytes())
+        assert data["name"] == "Ravi Kalluri"
 
 
+@pytest.mark.unit
 class TestLoadUserInfoPartial:
     """Tests for load_user_info_partial function."""
 
-    def test_loads_complete_config(self):
+    def test_loads_complete_config(self, fake_user_info):
         """Test loading complete user info."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
-
-            user_data = {"name": "Ravi Kalluri", "rating": 3.93}
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
+        fake_user_info(USER_JSON)
 
-            partial = load_user_info_partial(base_path)
+        partial = load_user_info_partial(FAKE_BASE_PATH)
 
-            assert partial.name == "Ravi Kalluri"
-            assert partial.rating == 3.93
-            assert partial.missing_fields == []
+        assert partial.name == "Ravi Kalluri"
+        assert partial.rating == 3.93
+        assert partial.missing_fields == []
 
-    def test_detects_missing_name(self):
+    def test_detects_missing_name(self, fake_user_info):
         """Test that missing name is detected."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        fake_user_info(USER_JSON_NO_NAME)
 
-            user_data = {"rating": 3.93}
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
+        partial = load_user_info_partial(FAKE_BASE_PATH)
 
-            partial = load_user_info_partial(base_path)
+        assert partial.name is None
+        assert partial.rating == 3.93
+        assert "name" in partial.missing_fields
 
-            assert partial.name is None
-            assert partial.rating == 3.93
-            assert "name" in partial.missing_fields
-
-    def test_detects_missing_rating(self):
+    def test_detects_missing_rating(self, fake_user_info):
         """Test that missing rating is detected."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
-
-            user_data = {"name": "Ravi Kalluri"}
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
+        fake_user_info(USER_JSON_NO_RATING)
 
-            partial = load_user_info_partial(base_path)
+        partial = load_user_info_partial(FAKE_BASE_PATH)
 
-            assert partial.name == "Ravi Kalluri"
-            assert partial.rating is None
-            assert "rating" in partial.missing_fields
+        assert partial.name == "Ravi Kalluri"
+        assert partial.rating is None
+        assert "rating" in partial.missing_fields
 
 
+@pytest.mark.unit
 class TestPromptUserInfoSetup:
     """Tests for prompt_user_info_setup function."""
 
-    def test_prompts_for_name_and_rating(self):
+    def test_prompts_for_name_and_rating(self, fake_input):
         """Test that name and rating are prompted."""
-        inputs = iter(["Ravi Kalluri", "3.93"])
-        with patch('builtins.input', side_effect=lambda _: next(inputs)):
-            user_info = prompt_user_info_setup()
+        fake_input("Ravi Kalluri", "3.93")
+        user_info = prompt_user_info_setup()
 
-            assert user_info.name == "Ravi Kalluri"
-            assert user_info.rating == 3.93
+        assert user_info.name == "Ravi Kalluri"
+        assert user_info.rating == 3.93
 
-    def test_reprompts_on_invalid_name(self):
+    def test_reprompts_on_invalid_name(self, fake_input):
         """Test that invalid name causes re-prompt."""
-        inputs = iter(["", "Ravi Kalluri", "3.93"])
-        with patch('builtins.input', side_effect=lambda _: next(inputs)):
-            user_info = prompt_user_info_setup()
-            assert user_info.name == "Ravi Kalluri"
+        fake_input("", "Ravi Kalluri", "3.93")
+        user_info = prompt_user_info_setup()
+        assert user_info.name == "Ravi Kalluri"
 
-    def test_reprompts_on_invalid_rating(self):
+    def test_reprompts_on_invalid_rating(self, fake_input):
         """Test that invalid rating causes re-prompt."""
-        inputs = iter(["Ravi Kalluri", "abc", "1.5", "3.93"])
-        with patch('builtins.input', side_effect=lambda _: next(inputs)):
-            user_info = prompt_user_info_setup()
-            assert user_info.rating == 3.93
+        fake_input("Ravi Kalluri", "abc", "1.5", "3.93")
+        user_info = prompt_user_info_setup()
+        assert user_info.rating == 3.93
 
     def test_raises_on_eof(self):
         """Test that EOF raises UserInfoError."""
@@ -407,107 +371,85 @@ class TestPromptUserInfoSetup:
             with pytest.raises(UserInfoError, match="cancelled"):
                 prompt_user_info_setup()
 
-    def test_partial_prompts_only_for_name(self):
+    def test_partial_prompts_only_for_name(self, fake_input):
         """Test that partial config with only rating prompts for name only."""
         partial = PartialUserInfo(name=None, rating=3.93, missing_fields=["name"])
-        inputs = iter(["Ravi Kalluri"])
-        with patch('builtins.input', side_effect=lambda _: next(inputs)):
-            user_info = prompt_user_info_setup(partial)
+        fake_input("Ravi Kalluri")
+        user_info = prompt_user_info_setup(partial)
 
-            assert user_info.name == "Ravi Kalluri"
-            assert user_info.rating == 3.93
+        assert user_info.name == "Ravi Kalluri"
+        assert user_info.rating == 3.93
 
-    def test_partial_prompts_only_for_rating(self):
+    def test_partial_prompts_only_for_rating(self, fake_input):
         """Test that partial config with only name prompts for rating only."""
         partial = PartialUserInfo(name="Ravi Kalluri", rating=None, missing_fields=["rating"])
-        inputs = iter(["3.93"])
-        with patch('builtins.input', side_effect=lambda _: next(inputs)):
-            user_info = prompt_user_info_setup(partial)
+        fake_input("3.93")
+        user_info = prompt_user_info_setup(partial)
 
-            assert user_info.name == "Ravi Kalluri"
-            assert user_info.rating == 3.93
+        assert user_info.name == "Ravi Kalluri"
+        assert user_info.rating == 3.93
 
 
+@pytest.mark.io
 class TestEnsureUserInfo:
     """Tests for ensure_user_info function."""
 
-    def test_loads_existing_config(self):
+    def test_loads_existing_config(self, config_dir):
         """Test that existing config is loaded silently."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        base_path = config_dir.parent
 
-            user_data = {"name": "Ravi Kalluri", "rating": 3.93}
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
+        (config_dir / "userInfo.json").write_text(USER_JSON)
 
-            user_info = ensure_user_info(base_path)
+        user_info = ensure_user_info(base_path)
 
-            assert user_info.name == "Ravi Kalluri"
-            assert user_info.rating == 3.93
+        assert user_info.name == "Ravi Kalluri"
+        assert user_info.rating == 3.93
 
-    def test_prompts_when_file_missing(self):
+    def test_prompts_when_file_missing(self, tmp_path, fake_input):
         """Test that setup is prompted when file is missing."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        base_path = tmp_path
+        config_dir = base_path / "config"
 
-            inputs = iter(["Ravi Kalluri", "3.93"])
-            with patch('builtins.input', side_effect=lambda _: next(inputs)):
-                user_info = ensure_user_info(base_path)
+        fake_input("Ravi Kalluri", "3.93")
+        user_info = ensure_user_info(base_path)
 
-            assert user_info.name == "Ravi Kalluri"
-            # Verify file was saved
-            assert (config_dir / "userInfo.json").exists()
+        assert user_info.name == "Ravi Kalluri"
+        # Verify file was saved
+        assert (config_dir / "userInfo.json").exists()
 
-    def test_prompts_when_json_invalid(self):
+    def test_prompts_when_json_invalid(self, config_dir, fake_input):
         """Test that full setup is prompted when JSON is invalid."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        base_path = config_dir.parent
 
-            (config_dir / "userInfo.json").write_text("not valid json")
+        (config_dir / "userInfo.json").write_text("not valid json")
 
-            inputs = iter(["Ravi Kalluri", "3.93"])
-            with patch('builtins.input', side_effect=lambda _: next(inputs)):
-                user_info = ensure_user_info(base_path)
+        fake_input("Ravi Kalluri", "3.93")
+        user_info = ensure_user_info(base_path)
 
-            assert user_info.name == "Ravi Kalluri"
+        assert user_info.name == "Ravi Kalluri"
 
-    def test_prompts_only_for_missing_name(self):
+    def test_prompts_only_for_missing_name(self, config_dir, fake_input):
         """Test that only name is prompted when rating exists."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        base_path = config_dir.parent
 
-            # File has rating but no name
-            user_data = {"rating": 3.93}
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
+        # File has rating but no name
+        (config_dir / "userInfo.json").write_text(USER_JSON_NO_NAME)
 
-            inputs = iter(["Ravi Kalluri"])
-            with patch('builtins.input', side_effect=lambda _: next(inputs)):
-                user_info = ensure_user_info(base_path)
+        fake_input("Ravi Kalluri")
+        user_info = ensure_user_info(base_path)
 
-            assert user_info.name == "Ravi Kalluri"
-            assert user_info.rating == 3.93
+        assert user_info.name == "Ravi Kalluri"
+        assert user_info.rating == 3.93
 
-    def test_prompts_only_for_missing_rating(self):
+    def test_prompts_only_for_missing_rating(self, config_dir, fake_input):
         """Test that only rating is prompted when name exists."""
-        with TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            config_dir = base_path / "config"
-            config_dir.mkdir()
+        base_path = config_dir.parent
 
-            # File has name but no rating
-            user_data = {"name": "Ravi Kalluri"}
-            (config_dir / "userInfo.json").write_text(json.dumps(user_data))
+        # File has name but no rating
+        (config_dir / "userInfo.json").write_text(USER_JSON_NO_RATING)
 
-            inputs = iter(["3.93"])
-            with patch('builtins.input', side_effect=lambda _: next(inputs)):
-                user_info = ensure_user_info(base_path)
+        fake_input("3.93")
+        user_info = ensure_user_info(base_path)
 
-            assert user_info.name == "Ravi Kalluri"
-            assert user_info.rating == 3.93
+        assert user_info.name == "Ravi Kalluri"
+        assert user_info.rating == 3.93
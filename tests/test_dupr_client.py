@@ -15,10 +15,30 @@ from src.dupr_client import (
     RateLimitError
 )
 
+# HTTP calls are mocked throughout; nothing here touches the network or disk
+pytestmark = pytest.mark.unit
 
-@pytest.fixture
+
+def responses(*items):
+    """Build a requests.post side_effect sequence.
+
+    Each item is either an exception to raise or an HTTP status code; 200
+    responses carry an empty successful search result.
+    """
+    out = []
+    for item in items:
+        if isinstance(item, Exception):
+            out.append(item)
+        else:
+            response = Mock(status_code=item)
+            response.json.return_value = {"status": "SUCCESS", "result": {"hits": []}}
+            out.append(response)
+    return out
+
+
+@pytest.fixture(scope="module")
 def mock_config():
-    """Create a mock config for testing."""
+    """Create a mock config for testing (shared; tests never mutate it)."""
     config = Mock(spec=Config)
     config.token = "test_token"
     config.API_URL = "https://api.dupr.gg/player/v1.0/search"
@@ -163,18 +183,11 @@ class TestErrorHandling:
         """Test that network errors trigger retries."""
         with patch('requests.post') as mock_post:
             # First two calls fail, third succeeds
-            mock_response_ok = Mock()
-            mock_response_ok.status_code = 200
-            mock_response_ok.json.return_value = {
-                "status": "SUCCESS",
-                "result": {"hits": []}
-            }
-
-            mock_post.side_effect = [
+            mock_post.side_effect = responses(
                 requests.RequestException("Network error"),
                 requests.RequestException("Network error"),
-                mock_response_ok
-            ]
+                200
+            )
 
             players = client.search_players("John")
             assert players == []
@@ -183,7 +196,9 @@ class TestErrorHandling:
     def test_raises_api_error_after_max_retries(self, client):
         """Test that DUPRAPIError is raised after max retries."""
         with patch('requests.post') as mock_post:
-            mock_post.side_effect = requests.RequestException("Network error")
+            mock_post.side_effect = responses(
+                *[requests.RequestException("Network error")] * client.config.RETRY_COUNT
+            )
 
             with pytest.raises(DUPRAPIError):
                 client.search_players("John")
@@ -191,19 +206,9 @@ class TestErrorHandling:
     def test_retries_on_rate_limit(self, client):
         """Test that 429 responses trigger rate limit wait and retry."""
         with patch('requests.post') as mock_post:
-            mock_response_429 = Mock()
-            mock_response_429.status_code = 429
-
-            mock_response_ok = Mock()
-            mock_response_ok.status_code = 200
-            mock_response_ok.json.return_value = {
-                "status": "SUCCESS",
-                "result": {"hits": []}
-            }
+            mock_post.side_effect = responses(429, 200)
 
-            mock_post.side_effect = [mock_response_429, mock_response_ok]
-
-            players = client.search_players("John")
+            client.search_players("John")
             assert mock_post.call_count == 2
 
 
@@ -253,57 +258,32 @@ class TestPlayerParsing:
             assert players == []
 
 
+def _player(ratings: PlayerRating, id: int = 1) -> DUPRPlayer:
+    """Build a DUPRPlayer that differs only in id and ratings."""
+    return DUPRPlayer(
+        id=id,
+        full_name="John Doe",
+        first_name="John",
+        last_name="Doe",
+        short_address="",
+        ratings=ratings,
+        dupr_id="X"
+    )
+
+
 class TestDUPRPlayerProperties:
     """Tests for DUPRPlayer dataclass."""
 
     def test_profile_url(self):
         """Test profile URL generation."""
-        player = DUPRPlayer(
-            id=12345,
-            full_name="John Doe",
-            first_name="John",
-            last_name="Doe",
-            short_address="Edmonton",
-            ratings=PlayerRating(None, None, False, False),
-            dupr_id="ABC"
-        )
+        player = _player(PlayerRating(None, None, False, False), id=12345)
         assert player.profile_url == "https://dashboard.dupr.com/dashboard/player/12345"
 
-    def test_best_rating_prefers_doubles(self):
-        """Test that best_rating prefers doubles over singles."""
-        player = DUPRPlayer(
-            id=1,
-            full_name="John",
-            first_name="John",
-            last_name="Doe",
-            short_address="",
-            ratings=PlayerRating(singles=3.0, doubles=4.0, singles_verified=True, doubles_verified=True),
-            dupr_id="X"
-        )
-        assert player.best_rating == 4.0
-
-    def test_best_rating_falls_back_to_singles(self):
-        """Test that best_rating uses singles when no doubles."""
-        player = DUPRPlayer(
-            id=1,
-            full_name="John",
-            first_name="John",
-            last_name="Doe",
-            short_address="",
-            ratings=PlayerRating(singles=3.0, doubles=None, singles_verified=True, doubles_verified=False),
-            dupr_id="X"
-        )
-        assert player.best_rating == 3.0
-
-    def test_best_rating_none_when_no_ratings(self):
-        """Test that best_rating is None when no ratings available."""
-        player = DUPRPlayer(
-            id=1,
-            full_name="John",
-            first_name="John",
-            last_name="Doe",
-            short_address="",
-            ratings=PlayerRating(singles=None, doubles=None, singles_verified=False, doubles_verified=False),
-            dupr_id="X"
-        )
-        assert player.best_rating is None
+    @pytest.mark.parametrize("ratings,expected", [
+        (PlayerRating(singles=3.0, doubles=4.0, singles_verified=True, doubles_verified=True), 4.0),
+        (PlayerRating(singles=3.0, doubles=None, singles_verified=True, doubles_verified=False), 3.0),
+        (PlayerRating(singles=None, doubles=None, singles_verified=False, doubles_verified=False), None),
+    ], ids=["prefers_doubles", "falls_back_to_singles", "none_when_no_ratings"])
+    def test_best_rating(self, ratings, expected):
+        """Test that best_rating prefers doubles, then singles, else None."""
+        assert _player(ratings).best_rating == expected
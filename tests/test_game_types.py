@@ -1,10 +1,11 @@
 """Tests for game types module."""
 
+import io
 import pytest
-from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from src.game_types import (
+    _parse_ladder_lines,
+    _parse_team_lines,
     parse_dupr_ladder_players,
     parse_partner_dupr_teams,
     calculate_team_rating,
@@ -16,120 +17,102 @@ from src.game_types import (
 class TestParseDUPRLadderPlayers:
     """Tests for DUPR Ladder player list parsing."""
 
-    def test_parses_player_names(self):
+    @pytest.mark.io
+    def test_parses_player_names(self, ladder_file):
         """Test parsing player names from file."""
-        with NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("John Doe\n")
-            f.write("Jane Smith\n")
-            f.write("Bob Wilson\n")
-            f.flush()
-
-            players = parse_dupr_ladder_players(Path(f.name))
-            assert len(players) == 3
-            assert "John Doe" in players
-            assert "Jane Smith" in players
-            assert "Bob Wilson" in players
-
-    def test_skips_empty_lines(self):
-        """Test that empty lines are skipped."""
-        with NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("John Doe\n")
-            f.write("\n")
-            f.write("Jane Smith\n")
-            f.write("   \n")
-            f.flush()
-
-            players = parse_dupr_ladder_players(Path(f.name))
-            assert len(players) == 2
-
-    def test_strips_whitespace(self):
-        """Test that whitespace is stripped from names."""
-        with NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("  John Doe  \n")
-            f.write("Jane Smith\n")
-            f.flush()
-
-            players = parse_dupr_ladder_players(Path(f.name))
-            assert players[0] == "John Doe"
+        players = parse_dupr_ladder_players(ladder_file)
+        assert len(players) == 3
+        assert set(players) == {"John Doe", "Jane Smith", "Bob Wilson"}
+
+    @pytest.mark.io
+    def test_parses_open_handle(self, ladder_file):
+        """Test that an already-open file can be parsed without reopening it."""
+        with ladder_file.open() as f:
+            assert _parse_ladder_lines(f) == ["John Doe", "Jane Smith", "Bob Wilson"]
+
+    @pytest.mark.parametrize("content,expected", [
+        ("John Doe\nJane Smith\nBob Wilson\n", ["John Doe", "Jane Smith", "Bob Wilson"]),
+        ("John Doe\n\nJane Smith\n   \n", ["John Doe", "Jane Smith"]),
+        ("  John Doe  \nJane Smith\n", ["John Doe", "Jane Smith"]),
+    ], ids=["names", "skips_empty_lines", "strips_whitespace"])
+    def test_parses_lines(self, content, expected):
+        """Test that names are stripped and blank lines skipped."""
+        assert _parse_ladder_lines(io.StringIO(content)) == expected
 
 
 class TestParsePartnerDUPRTeams:
     """Tests for Partner DUPR team list parsing."""
 
-    def test_parses_team_pairs(self):
+    @pytest.mark.io
+    def test_parses_team_pairs(self, partner_file):
         """Test parsing team pairs from file."""
-        with NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("John Doe / Jane Smith\n")
-            f.write("Bob Wilson / Alice Brown\n")
-            f.flush()
-
-            teams = parse_partner_dupr_teams(Path(f.name))
-            assert len(teams) == 2
-            assert teams[0].player1 == "John Doe"
-            assert teams[0].player2 == "Jane Smith"
-            assert teams[1].player1 == "Bob Wilson"
-            assert teams[1].player2 == "Alice Brown"
-
-    def test_skips_invalid_lines(self):
-        """Test that lines without / separator are skipped."""
-        with NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("John Doe / Jane Smith\n")
-            f.write("Invalid Line Without Separator\n")
-            f.write("Bob Wilson / Alice Brown\n")
-            f.flush()
-
-            teams = parse_partner_dupr_teams(Path(f.name))
-            assert len(teams) == 2
-
-    def test_skips_empty_lines(self):
-        """Test that empty lines are skipped."""
-        with NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("John Doe / Jane Smith\n")
-            f.write("\n")
-            f.write("Bob Wilson / Alice Brown\n")
-            f.flush()
-
-            teams = parse_partner_dupr_teams(Path(f.name))
-            assert len(teams) == 2
-
-    def test_strips_whitespace_from_names(self):
-        """Test that whitespace is stripped from player names."""
-        with NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("  John Doe  /  Jane Smith  \n")
-            f.flush()
-
-            teams = parse_partner_dupr_teams(Path(f.name))
-            assert teams[0].player1 == "John Doe"
-            assert teams[0].player2 == "Jane Smith"
+        teams = parse_partner_dupr_teams(partner_file)
+        assert len(teams) == 2
+        assert teams[0].player1 == "John Doe"
+        assert teams[0].player2 == "Jane Smith"
+        assert teams[1].player1 == "Bob Wilson"
+        assert teams[1].player2 == "Alice Brown"
+
+    @pytest.mark.io
+    def test_parses_open_handle(self, partner_file):
+        """Test that an already-open file can be parsed without reopening it."""
+        with partner_file.open() as f:
+            teams = _parse_team_lines(f)
+        assert [team.players for team in teams] == [
+            ("John Doe", "Jane Smith"),
+            ("Bob Wilson", "Alice Brown"),
+        ]
+
+    @pytest.mark.parametrize("content,expected", [
+        (
+            "John Doe / Jane Smith\nBob Wilson / Alice Brown\n",
+            [("John Doe", "Jane Smith"), ("Bob Wilson", "Alice Brown")],
+        ),
+        (
+            "John Doe / Jane Smith\nInvalid Line Without Separator\nBob Wilson / Alice Brown\n",
+            [("John Doe", "Jane Smith"), ("Bob Wilson", "Alice Brown")],
+        ),
+        (
+            "John Doe / Jane Smith\n\nBob Wilson / Alice Brown\n",
+            [("John Doe", "Jane Smith"), ("Bob Wilson", "Alice Brown")],
+        ),
+        (
+            "  John Doe  /  Jane Smith  \n",
+            [("John Doe", "Jane Smith")],
+        ),
+        (
+            "John Doe / Jane Smith / Bob Wilson\nBob Wilson / Alice Brown\n",
+            [("Bob Wilson", "Alice Brown")],
+        ),
+    ], ids=["pairs", "skips_invalid_lines", "skips_empty_lines", "strips_whitespace",
+            "skips_malformed_lines"])
+    def test_parses_lines(self, content, expected):
+        """Test that team lines are split, stripped and filtered."""
+        teams = _parse_team_lines(io.StringIO(content))
+        assert [team.players for team in teams] == expected
+
+    @pytest.mark.io
+    @pytest.mark.slow
+    def test_large_partner_file(self, tmp_path):
+        """Test parsing a 10k-line team list."""
+        path = tmp_path / "teams.txt"
+        path.write_text("A / B\n" * 10_000)
+
+        assert len(parse_partner_dupr_teams(path)) == 10_000
 
 
 class TestCalculateTeamRating:
     """Tests for team rating calculation."""
 
-    def test_formula_with_different_ratings(self):
-        """Test the 35%/65% formula with different ratings."""
-        # Higher = 4.0, Lower = 3.0
-        # Expected: 0.35 * 4.0 + 0.65 * 3.0 = 1.4 + 1.95 = 3.35
-        result = calculate_team_rating(4.0, 3.0)
-        assert result == 3.35
-
-    def test_formula_order_independent(self):
-        """Test that order of arguments doesn't matter."""
-        result1 = calculate_team_rating(4.0, 3.0)
-        result2 = calculate_team_rating(3.0, 4.0)
-        assert result1 == result2
-
-    def test_equal_ratings(self):
-        """Test with equal ratings."""
-        result = calculate_team_rating(3.5, 3.5)
-        assert result == 3.5
-
-    def test_real_world_example(self):
-        """Test with realistic DUPR ratings."""
-        # Two players: 4.2 and 3.8
-        # Expected: 0.35 * 4.2 + 0.65 * 3.8 = 1.47 + 2.47 = 3.94
-        result = calculate_team_rating(4.2, 3.8)
-        assert result == 3.94
+    @pytest.mark.parametrize("higher,lower,expected", [
+        (4.0, 3.0, 3.35),  # 0.35 * 4.0 + 0.65 * 3.0 = 1.4 + 1.95
+        (3.0, 4.0, 3.35),  # argument order doesn't matter
+        (3.5, 3.5, 3.5),   # equal ratings
+        (4.2, 3.8, 3.94),  # realistic DUPR ratings: 1.47 + 2.47
+    ], ids=["different_ratings", "order_independent", "equal_ratings", "real_world"])
+    def test_team_rating(self, higher, lower, expected):
+        """Test the 35%/65% weighting of the higher and lower ratings."""
+        assert calculate_team_rating(higher, lower) == pytest.approx(expected, rel=0, abs=1e-9)
 
 
 class TestTeamDataclass:
@@ -2,9 +2,6 @@
 
 import pytest
 from pathlib import Path
-from tempfile import TemporaryDirectory
-
-from playwright.sync_api import Page, expect
 
 from src.html_generator import (
     PlayerWithRating,
@@ -13,266 +10,196 @@ from src.html_generator import (
     generate_partner_dupr_html
 )
 
+# Skip the whole module, rather than erroring at collection, when Playwright
+# isn't installed.
+sync_api = pytest.importorskip("playwright.sync_api")
+Page, expect = sync_api.Page, sync_api.expect
+
+# Keep this module on one xdist worker so it reuses one browser and context;
+# every test renders its page to disk, so the whole module is io.
+pytestmark = [pytest.mark.xdist_group("html_playwright"), pytest.mark.io]
+
+
+_DUPR_URL = "https://dashboard.dupr.com/dashboard/player/123"
+
 
 def make_player(name: str, rating: float, found: bool = True) -> PlayerWithRating:
     """Helper to create test players."""
     return PlayerWithRating(
         name=name,
         rating=rating,
-        profile_url=f"https://dashboard.dupr.com/dashboard/player/123" if found else None,
+        profile_url=_DUPR_URL if found else None,
         found=found,
         search_method="Test search"
     )
 
 
-@pytest.fixture
-def temp_html_dir():
-    """Create a temporary directory for HTML files."""
-    with TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+@pytest.fixture(scope="session")
+def html_dir(tmp_path_factory):
+    """Directory for rendered HTML files, shared by the whole session."""
+    return tmp_path_factory.mktemp("html")
+
+
+@pytest.fixture(scope="class")
+def ladder_page(context, html_dir):
+    """Two-player ladder page, rendered and opened once per test class."""
+    players = [
+        make_player("John Doe", 4.12, found=True),
+        make_player("Second", 3.0)
+    ]
+    html_path = html_dir / "ladder.html"
+    generate_dupr_ladder_html(players, html_path)
+
+    page = context.new_page()
+    page.goto(f"file://{html_path}")
+    yield page
+    page.close()
 
 
 class TestDUPRLadderHTML:
     """Playwright tests for DUPR Ladder HTML output."""
 
-    def test_renders_page_title(self, page: Page, temp_html_dir: Path):
+    def test_renders_page_title(self, ladder_page: Page):
         """Test that page has correct title."""
-        players = [make_player("John Doe", 4.0)]
-        html_path = temp_html_dir / "ladder.html"
-        generate_dupr_ladder_html(players, html_path)
+        expect(ladder_page).to_have_title("DUPR Ladder Rankings")
 
-        page.goto(f"file://{html_path}")
-        expect(page).to_have_title("DUPR Ladder Rankings")
-
-    def test_displays_player_name(self, page: Page, temp_html_dir: Path):
+    def test_displays_player_name(self, ladder_page: Page):
         """Test that player names are displayed."""
-        players = [make_player("John Doe", 4.0)]
-        html_path = temp_html_dir / "ladder.html"
-        generate_dupr_ladder_html(players, html_path)
-
-        page.goto(f"file://{html_path}")
-        expect(page.get_by_text("John Doe")).to_be_visible()
+        expect(ladder_page.get_by_text("John Doe")).to_be_visible()
 
-    def test_displays_rating_badge(self, page: Page, temp_html_dir: Path):
+    def test_displays_rating_badge(self, ladder_page: Page):
         """Test that rating badges are displayed."""
-        players = [make_player("John Doe", 4.12)]
-        html_path = temp_html_dir / "ladder.html"
-        generate_dupr_ladder_html(players, html_path)
-
-        page.goto(f"file://{html_path}")
-        expect(page.get_by_text("4.12")).to_be_visible()
+        expect(ladder_page.get_by_text("4.12")).to_be_visible()
 
-    def test_displays_ranking_numbers(self, page: Page, temp_html_dir: Path):
+    def test_displays_ranking_numbers(self, ladder_page: Page):
         """Test that ranking numbers are displayed."""
-        players = [
-            make_player("First", 4.0),
-            make_player("Second", 3.0)
-        ]
-        html_path = temp_html_dir / "ladder.html"
-        generate_dupr_ladder_html(players, html_path)
+        expect(ladder_page.locator(".rank-badge").first).to_be_visible()
 
-        page.goto(f"file://{html_path}")
-        expect(page.locator(".rank-badge").first).to_be_visible()
-
-    def test_player_links_are_clickable(self, page: Page, temp_html_dir: Path):
+    def test_player_links_are_clickable(self, ladder_page: Page):
         """Test that player profile links are present and clickable."""
-        players = [make_player("John Doe", 4.0, found=True)]
-        html_path = temp_html_dir / "ladder.html"
-        generate_dupr_ladder_html(players, html_path)
-
-        page.goto(f"file://{html_path}")
-        link = page.locator(".profile-link").first
+        link = ladder_page.locator(".profile-link").first
         expect(link).to_be_visible()
-        expect(link).to_have_attribute("href", "https://dashboard.dupr.com/dashboard/player/123")
+        expect(link).to_have_attribute("href", _DUPR_URL)
 
-    def test_resolution_summary_visible(self, page: Page, temp_html_dir: Path):
+    def test_resolution_summary_visible(self, page: Page, html_dir: Path):
         """Test that resolution summary is visible."""
         players = [
             make_player("Found", 4.0, found=True),
             make_player("Not Found", 2.5, found=False)
         ]
-        html_path = temp_html_dir / "ladder.html"
+        html_path = html_dir / "ladder_unresolved.html"
         generate_dupr_ladder_html(players, html_path)
 
         page.goto(f"file://{html_path}")
         expect(page.get_by_text("1/2")).to_be_visible()
 
 
-class TestPartnerDUPRHTML:
-    """Playwright tests for Partner DUPR HTML output."""
-
-    def test_renders_page_title(self, page: Page, temp_html_dir: Path):
-        """Test that page has correct title."""
-        teams = [TeamWithRatings(
-            player1=make_player("John", 4.0),
-            player2=make_player("Jane", 3.5),
-            team_rating=3.675
-        )]
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        expect(page).to_have_title("Partner DUPR")
-
-    def test_displays_pool_header(self, page: Page, temp_html_dir: Path):
-        """Test that pool headers are displayed."""
-        teams = [TeamWithRatings(
-            player1=make_player("John", 4.0),
-            player2=make_player("Jane", 3.5),
-            team_rating=3.675
-        )]
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        expect(page.get_by_text("POOL A")).to_be_visible()
-
-    def test_displays_both_players(self, page: Page, temp_html_dir: Path):
-        """Test that both team players are displayed."""
-        teams = [TeamWithRatings(
-            player1=make_player("John Doe", 4.0),
-            player2=make_player("Jane Smith", 3.5),
-            team_rating=3.675
-        )]
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        expect(page.get_by_text("John Doe")).to_be_visible()
-        expect(page.get_by_text("Jane Smith")).to_be_visible()
-
-    def test_displays_team_rating(self, page: Page, temp_html_dir: Path):
-        """Test that team combined rating is displayed."""
-        teams = [TeamWithRatings(
-            player1=make_player("John", 4.0),
-            player2=make_player("Jane", 3.5),
+def make_teams(count: int, step: float) -> list:
+    """Helper to create test teams with ratings descending by step."""
+    return [
+        TeamWithRatings(
+            player1=make_player(f"P{i}A", 4.0 - i * step),
+            player2=make_player(f"P{i}B", 3.5 - i * step),
+            team_rating=3.7 - i * step
+        )
+        for i in range(count)
+    ]
+
+
+# Each case renders one page and runs every (kind, target, arg) check on it:
+#   title    - page title equals target
+#   content  - static text target appears in the page source (no browser query)
+#   text     - text target is visible
+#   visible  - the arg-th element (default first) matching selector target is visible
+#   contains - first element matching selector target contains text arg
+PARTNER_CASES = [
+    pytest.param(
+        [TeamWithRatings(
+            player1=make_player("John Doe", 4.12, found=True),
+            player2=make_player("Jane Smith", 3.45, found=True),
             team_rating=3.68
-        )]
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        expect(page.locator(".team-dupr").first).to_be_visible()
-        expect(page.get_by_text("3.68")).to_be_visible()
-
-    def test_displays_individual_ratings(self, page: Page, temp_html_dir: Path):
-        """Test that individual ratings are displayed."""
-        teams = [TeamWithRatings(
-            player1=make_player("John", 4.12),
-            player2=make_player("Jane", 3.45),
-            team_rating=3.68
-        )]
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        expect(page.get_by_text("4.12")).to_be_visible()
-        expect(page.get_by_text("3.45")).to_be_visible()
-
-    def test_both_player_links_present(self, page: Page, temp_html_dir: Path):
-        """Test that both players have profile links."""
-        teams = [TeamWithRatings(
-            player1=make_player("John", 4.0, found=True),
-            player2=make_player("Jane", 3.5, found=True),
-            team_rating=3.675
-        )]
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        links = page.locator(".profile-link")
-        expect(links.nth(0)).to_be_visible()
-        expect(links.nth(1)).to_be_visible()
-
-    def test_pool_metadata_displayed(self, page: Page, temp_html_dir: Path):
-        """Test that pool metadata (team count) is displayed."""
-        # Create 5 teams to ensure we get a pool with 5 teams
-        teams = []
-        for i in range(5):
-            teams.append(TeamWithRatings(
-                player1=make_player(f"P{i}A", 4.0 - i * 0.1),
-                player2=make_player(f"P{i}B", 3.5 - i * 0.1),
-                team_rating=3.7 - i * 0.1
-            ))
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        expect(page.get_by_text("5 Teams")).to_be_visible()
-
-    def test_multiple_pools_rendered(self, page: Page, temp_html_dir: Path):
-        """Test that multiple pools are rendered for 10+ teams."""
-        teams = []
-        for i in range(10):
-            teams.append(TeamWithRatings(
-                player1=make_player(f"P{i}A", 4.0 - i * 0.05),
-                player2=make_player(f"P{i}B", 3.5 - i * 0.05),
-                team_rating=3.7 - i * 0.05
-            ))
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        expect(page.get_by_text("POOL A")).to_be_visible()
-        expect(page.get_by_text("POOL B")).to_be_visible()
-
-    def test_team_ranking_within_pool(self, page: Page, temp_html_dir: Path):
-        """Test that team ranking numbers are displayed within pool."""
-        teams = []
-        for i in range(5):
-            teams.append(TeamWithRatings(
-                player1=make_player(f"P{i}A", 4.0 - i * 0.1),
-                player2=make_player(f"P{i}B", 3.5 - i * 0.1),
-                team_rating=3.7 - i * 0.1
-            ))
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        # Should have team ranks 1-5 in the pool
-        expect(page.locator(".team-rank").first).to_contain_text("1")
-
-    def test_pool_card_structure(self, page: Page, temp_html_dir: Path):
-        """Test that pool cards have correct structure."""
-        teams = [TeamWithRatings(
-            player1=make_player("John", 4.0),
-            player2=make_player("Jane", 3.5),
-            team_rating=3.675
-        )]
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        # Check for pool card structure
-        expect(page.locator(".pool-card").first).to_be_visible()
-        expect(page.locator(".pool-header").first).to_be_visible()
-        expect(page.locator(".team-table").first).to_be_visible()
-
-    def test_header_stats_displayed(self, page: Page, temp_html_dir: Path):
-        """Test that header stats (teams, pools, resolved) are displayed."""
-        teams = []
-        for i in range(15):
-            teams.append(TeamWithRatings(
-                player1=make_player(f"P{i}A", 4.0 - i * 0.05),
-                player2=make_player(f"P{i}B", 3.5 - i * 0.05),
-                team_rating=3.7 - i * 0.05
-            ))
-        html_path = temp_html_dir / "partner.html"
-        generate_partner_dupr_html(teams, html_path)
-
-        page.goto(f"file://{html_path}")
-        expect(page.get_by_text("15 Teams")).to_be_visible()
-        expect(page.get_by_text("3 Pools")).to_be_visible()
-
-    def test_resolution_summary_in_header(self, page: Page, temp_html_dir: Path):
-        """Test that resolution summary is in header."""
-        teams = [TeamWithRatings(
+        )],
+        [
+            ("title", "Partner DUPR", None),
+            ("text", "POOL A", None),
+            ("text", "John Doe", None),
+            ("text", "Jane Smith", None),
+            ("text", "3.68", None),
+            ("text", "4.12", None),
+            ("text", "3.45", None),
+            ("visible", ".team-dupr", None),
+            ("visible", ".profile-link", 0),
+            ("visible", ".profile-link", 1),
+            ("visible", ".pool-card", None),
+            ("visible", ".pool-header", None),
+            ("visible", ".team-table", None),
+        ],
+        id="single_team",
+    ),
+    pytest.param(
+        make_teams(5, 0.1),
+        [
+            ("content", "5 Teams", None),
+            ("contains", ".team-rank", "1"),
+        ],
+        id="five_teams",
+    ),
+    pytest.param(
+        make_teams(10, 0.05),
+        [
+            ("text", "POOL A", None),
+            ("text", "POOL B", None),
+        ],
+        id="ten_teams",
+    ),
+    pytest.param(
+        make_teams(15, 0.05),
+        [
+            ("content", "15 Teams", None),
+            ("content", "3 Pools", None),
+        ],
+        id="fifteen_teams",
+    ),
+    pytest.param(
+        [TeamWithRatings(
             player1=make_player("Found", 4.0, found=True),
             player2=make_player("NotFound", 2.5, found=False),
             team_rating=3.0
-        )]
-        html_path = temp_html_dir / "partner.html"
+        )],
+        [
+            ("content", "1/2 players resolved", None),
+        ],
+        id="unresolved_player",
+    ),
+]
+
+
+def run_check(page: Page, content: str, kind: str, target: str, arg) -> None:
+    """Run one table-driven check against an already-loaded page."""
+    if kind == "title":
+        expect(page).to_have_title(target)
+    elif kind == "content":
+        assert target in content
+    elif kind == "text":
+        expect(page.get_by_text(target)).to_be_visible()
+    elif kind == "visible":
+        expect(page.locator(target).nth(arg or 0)).to_be_visible()
+    elif kind == "contains":
+        expect(page.locator(target).first).to_contain_text(arg)
+    else:
+        raise ValueError(f"Unknown check kind: {kind}")
+
+
+class TestPartnerDUPRHTML:
+    """Playwright tests for Partner DUPR HTML output."""
+
+    @pytest.mark.parametrize("teams,checks", PARTNER_CASES)
+    def test_renders_partner_page(self, page: Page, tmp_path: Path, teams, checks):
+        """Test that each rendered partner page passes all of its checks."""
+        html_path = tmp_path / "partner.html"
         generate_partner_dupr_html(teams, html_path)
 
         page.goto(f"file://{html_path}")
-        expect(page.get_by_text("1/2 players resolved")).to_be_visible()
+        content = page.content()
+        for kind, target, arg in checks:
+            run_check(page, content, kind, target, arg)
@@ -1,13 +1,14 @@
 """Tests for input_parser module."""
 
+import sys
 import pytest
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from io import StringIO
 
 from src.input_parser import (
     InputError,
+    _read_player_lines,
     prompt_game_type,
     read_player_list_interactive,
     parse_ladder_players_from_list,
@@ -43,8 +44,7 @@ class TestPromptGameType:
 
     def test_reprompts_on_invalid_input(self):
         """Test that invalid input causes re-prompt."""
-        inputs = iter(['invalid', '4', '1'])
-        with patch('builtins.input', side_effect=lambda _: next(inputs)):
+        with patch('builtins.input', side_effect=['invalid', '4', '1']):
             result = prompt_game_type()
             assert result == GameType.PARTNER_DUPR
 
@@ -58,10 +58,14 @@ class TestPromptGameType:
 class TestReadPlayerListInteractive:
     """Tests for interactive player list reading."""
 
+    @pytest.fixture(autouse=True)
+    def terminal_stdin(self, monkeypatch):
+        """Report stdin as a terminal so names are read through input()."""
+        monkeypatch.setattr(sys, "stdin", Mock(**{"isatty.return_value": True}))
+
     def test_reads_players_until_empty_line(self):
         """Test reading players until blank line."""
-        inputs = iter(['John Doe', 'Jane Smith', ''])
-        with patch('builtins.input', side_effect=lambda: next(inputs)):
+        with patch('builtins.input', side_effect=['John Doe', 'Jane Smith', '']):
             players = read_player_list_interactive()
             assert len(players) == 2
             assert 'John Doe' in players
@@ -69,8 +73,7 @@ class TestReadPlayerListInteractive:
 
     def test_strips_whitespace(self):
         """Test that whitespace is stripped from names."""
-        inputs = iter(['  John Doe  ', 'Jane Smith', ''])
-        with patch('builtins.input', side_effect=lambda: next(inputs)):
+        with patch('builtins.input', side_effect=['  John Doe  ', 'Jane Smith', '']):
             players = read_player_list_interactive()
             assert players[0] == 'John Doe'
 
@@ -83,20 +86,44 @@ class TestReadPlayerListInteractive:
     def test_reprompts_on_empty_input_then_succeeds(self):
         """Test that empty input causes re-prompt and succeeds on valid input."""
         # First attempt: empty, second attempt: valid
-        inputs = iter(['', 'John Doe', 'Jane Smith', ''])
-        with patch('builtins.input', side_effect=lambda: next(inputs)):
+        with patch('builtins.input', side_effect=['', 'John Doe', 'Jane Smith', '']):
             players = read_player_list_interactive()
             assert len(players) == 2
 
     def test_reprompts_on_single_player_then_succeeds(self):
         """Test that single player causes re-prompt and succeeds on valid input."""
         # First attempt: single player, second attempt: valid
-        inputs = iter(['John Doe', '', 'John Doe', 'Jane Smith', ''])
-        with patch('builtins.input', side_effect=lambda: next(inputs)):
+        with patch('builtins.input', side_effect=['John Doe', '', 'John Doe', 'Jane Smith', '']):
             players = read_player_list_interactive()
             assert len(players) == 2
 
 
+class TestReadPlayerListPiped:
+    """Tests for player list reading from piped (non-terminal) stdin."""
+
+    def test_reads_players_until_empty_line(self, monkeypatch):
+        """Test that piped lines are read up to the first blank line."""
+        monkeypatch.setattr(sys, "stdin", StringIO("  John Doe  \nJane Smith\n\nignored\n"))
+        with patch('builtins.input') as mock_input:
+            players = read_player_list_interactive()
+
+        assert players == ['John Doe', 'Jane Smith']
+        mock_input.assert_not_called()
+
+    def test_reprompts_then_reads_rest_of_stream(self, monkeypatch):
+        """Test that a re-prompt continues from where the stream left off."""
+        monkeypatch.setattr(sys, "stdin", StringIO("John Doe\n\nJohn Doe\nJane Smith\n\n"))
+
+        assert read_player_list_interactive() == ['John Doe', 'Jane Smith']
+
+    def test_raises_at_end_of_stream(self, monkeypatch):
+        """Test that running out of piped input cancels rather than re-prompting forever."""
+        monkeypatch.setattr(sys, "stdin", StringIO("John Doe\n"))
+
+        with pytest.raises(InputError, match="Input cancelled"):
+            read_player_list_interactive()
+
+
 class TestParseLadderPlayersFromList:
     """Tests for ladder player parsing from list."""
 
@@ -185,41 +212,33 @@ class TestParsePartnerTeamsFromFormattedList:
 class TestReadPlayersFromFile:
     """Tests for file-based player reading."""
 
-    def test_reads_players_from_file(self):
+    def test_reads_players_from_file(self, ladder_file):
         """Test reading players from a file."""
-        with NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("John Doe\n")
-            f.write("Jane Smith\n")
-            f.flush()
-
-            players = read_players_from_file(Path(f.name))
-            assert len(players) == 2
-            assert 'John Doe' in players
+        players = read_players_from_file(ladder_file)
+        assert players == ["John Doe", "Jane Smith", "Bob Wilson"]
 
     def test_raises_on_missing_file(self):
         """Test that missing file raises InputError."""
         with pytest.raises(InputError, match="File not found"):
             read_players_from_file(Path('/nonexistent/file.txt'))
 
-    def test_raises_on_empty_file(self):
+    def test_raises_on_empty_file(self, tmp_path):
         """Test that empty file raises InputError."""
-        with NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("")
-            f.flush()
-
-            with pytest.raises(InputError, match="File is empty"):
-                read_players_from_file(Path(f.name))
-
-    def test_skips_empty_lines(self):
-        """Test that empty lines are skipped."""
-        with NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("John Doe\n")
-            f.write("\n")
-            f.write("Jane Smith\n")
-            f.flush()
-
-            players = read_players_from_file(Path(f.name))
-            assert len(players) == 2
+        path = tmp_path / "empty.txt"
+        path.write_text("\n  \n")
+
+        with pytest.raises(InputError, match="File is empty"):
+            read_players_from_file(path)
+
+    @pytest.mark.parametrize("content,expected", [
+        ("John Doe\nJane Smith\n", ["John Doe", "Jane Smith"]),
+        ("John Doe\n\nJane Smith\n", ["John Doe", "Jane Smith"]),
+        ("  John Doe  \n\tJane Smith\n", ["John Doe", "Jane Smith"]),
+        ("", []),
+    ], ids=["names", "skips_empty_lines", "strips_whitespace", "empty"])
+    def test_reads_lines(self, content, expected):
+        """Test that lines are stripped and blank lines skipped."""
+        assert _read_player_lines(StringIO(content)) == expected
 
 
 class TestDetectInputFormat:
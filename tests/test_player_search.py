@@ -1,27 +1,37 @@
 """Tests for player search module."""
 
+import pickle
 import pytest
 from unittest.mock import Mock, MagicMock
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict
 
-from src.config import Config, PlayerOverride
+from src.config import PlayerOverride
 from src.dupr_client import DUPRPlayer, PlayerRating, DUPRAPIError
 from src.player_search import PlayerSearcher, SearchResult, SHORT_COMMON_LASTNAMES
+from src.player_registry import PlayerRegistry
 
 
-@pytest.fixture
-def mock_config():
-    """Create a mock config for testing."""
-    config = Mock(spec=Config)
-    config.overrides = {}
-    config.ALBERTA_TEXT = "Alberta, Canada"
-    config.ALBERTA_LAT = 53.9
-    config.ALBERTA_LNG = -116.5
-    config.CANADA_TEXT = "Canada"
-    config.CANADA_LAT = 56.1
-    config.CANADA_LNG = -106.3
-    config.DEFAULT_RATING = 2.5
-    return config
+@dataclass
+class FakeConfig:
+    """Plain stand-in for Config with just the fields PlayerSearcher reads."""
+    overrides: Dict[str, PlayerOverride] = field(default_factory=dict)
+    ALBERTA_TEXT: str = "Alberta, Canada"
+    ALBERTA_LAT: float = 53.9
+    ALBERTA_LNG: float = -116.5
+    CANADA_TEXT: str = "Canada"
+    CANADA_LAT: float = 56.1
+    CANADA_LNG: float = -106.3
+    DEFAULT_RATING: float = 2.5
+
+
+@pytest.fixture(scope="module")
+def fake_config():
+    """Create a config for testing, shared by the module.
+
+    Tests that need overrides set them with monkeypatch so they are undone.
+    """
+    return FakeConfig()
 
 
 @pytest.fixture
@@ -31,19 +41,19 @@ def mock_client():
 
 
 @pytest.fixture
-def searcher(mock_config, mock_client):
+def searcher(fake_config, mock_client):
     """Create a PlayerSearcher with mocked dependencies."""
-    return PlayerSearcher(mock_config, mock_client)
+    return PlayerSearcher(fake_config, mock_client)
 
 
 def make_player(id: int, full_name: str, doubles: float = 3.5) -> DUPRPlayer:
     """Helper to create test players."""
-    parts = full_name.split()
+    first_name, _, rest = full_name.partition(" ")
     return DUPRPlayer(
         id=id,
         full_name=full_name,
-        first_name=parts[0] if parts else "",
-        last_name=parts[-1] if len(parts) > 1 else parts[0] if parts else "",
+        first_name=first_name,
+        last_name=rest.rpartition(" ")[2] or first_name,
         short_address="Edmonton, AB",
         ratings=PlayerRating(
             singles=None,
@@ -55,6 +65,11 @@ def make_player(id: int, full_name: str, doubles: float = 3.5) -> DUPRPlayer:
     )
 
 
+# Players shared by several tests; the searcher only reads them
+JOHN_DOE = make_player(1, "John Doe", 4.0)
+COLIN_NG = make_player(1, "Colin Ng", 3.5)
+
+
 class TestNameCleaning:
     """Tests for name cleaning functionality."""
 
@@ -72,6 +87,36 @@ class TestNameCleaning:
         assert searcher._clean_name("John Doe (new)") == "John Doe"
         assert searcher._clean_name("John Doe (visiting)") == "John Doe"
 
+    def test_cleans_stacked_annotations(self, searcher):
+        """Test removing an annotation followed by a guest marker."""
+        assert searcher._clean_name("John Doe (new) (G)") == "John Doe"
+
+    def test_cleans_leading_guest_marker(self, searcher):
+        """Test removing a guest marker placed before the name."""
+        assert searcher._clean_name("(G) Colin Ng") == "Colin Ng"
+
+    def test_cleans_leading_full_word_guest_marker(self, searcher):
+        """Test removing a (Guest) marker placed before the name."""
+        assert searcher._clean_name("(Guest) Colin Ng") == "Colin Ng"
+
+    def test_preserves_leading_non_guest_parenthetical(self, searcher):
+        """Test that only guest markers are removed from the front of a name."""
+        assert searcher._clean_name("(JR) Smith") == "(JR) Smith"
+
+    def test_cleans_nested_annotation(self, searcher):
+        """Test removing a trailing annotation that contains parentheses."""
+        assert searcher._clean_name("John Doe (new (G))") == "John Doe"
+
+    @pytest.mark.parametrize("name", [
+        "John Doe G)",
+        "John Doe (G",
+        "(G Colin Ng",
+        "John Doe new (G))",
+    ], ids=["missing_open", "missing_close", "leading_missing_close", "extra_close"])
+    def test_leaves_unbalanced_parentheses(self, searcher, name):
+        """Test that unbalanced parentheses are left as entered."""
+        assert searcher._clean_name(name) == name
+
     def test_preserves_clean_names(self, searcher):
         """Test that clean names are unchanged."""
         assert searcher._clean_name("Colin Ng") == "Colin Ng"
@@ -115,16 +160,16 @@ class TestShortCommonLastNames:
 class TestOverrideSearch:
     """Tests for player override functionality."""
 
-    def test_returns_override_when_exists(self, mock_config, mock_client):
+    def test_returns_override_when_exists(self, fake_config, mock_client, monkeypatch):
         """Test that override is returned when player is in overrides."""
-        mock_config.overrides = {
+        monkeypatch.setattr(fake_config, "overrides", {
             "john doe": PlayerOverride(
                 name="John Doe",
                 rating=4.5,
                 reason="Test override"
             )
-        }
-        searcher = PlayerSearcher(mock_config, mock_client)
+        })
+        searcher = PlayerSearcher(fake_config, mock_client)
 
         result = searcher.search_player("John Doe")
 
@@ -133,31 +178,46 @@ class TestOverrideSearch:
         assert "Override" in result.search_method
         mock_client.search_players.assert_not_called()
 
-    def test_override_case_insensitive(self, mock_config, mock_client):
+    def test_override_case_insensitive(self, fake_config, mock_client, monkeypatch):
         """Test that override lookup is case-insensitive."""
-        mock_config.overrides = {
+        monkeypatch.setattr(fake_config, "overrides", {
             "john doe": PlayerOverride(
                 name="John Doe",
                 rating=4.5,
                 reason="Test"
             )
-        }
-        searcher = PlayerSearcher(mock_config, mock_client)
+        })
+        searcher = PlayerSearcher(fake_config, mock_client)
 
         result = searcher.search_player("JOHN DOE")
         assert result.found is True
         assert result.rating == 4.5
 
-    def test_override_with_cleaned_name(self, mock_config, mock_client):
+    def test_override_keys_normalized_once(self, fake_config, mock_client, monkeypatch):
+        """Test that override keys not already lowercased still match."""
+        monkeypatch.setattr(fake_config, "overrides", {
+            "John Doe ": PlayerOverride(
+                name="John Doe",
+                rating=4.5,
+                reason="Test"
+            )
+        })
+        searcher = PlayerSearcher(fake_config, mock_client)
+
+        result = searcher.search_player("john doe")
+        assert result.found is True
+        assert result.rating == 4.5
+
+    def test_override_with_cleaned_name(self, fake_config, mock_client, monkeypatch):
         """Test that override works with cleaned name (guest marker removed)."""
-        mock_config.overrides = {
+        monkeypatch.setattr(fake_config, "overrides", {
             "colin ng": PlayerOverride(
                 name="Colin Ng",
                 rating=3.8,
                 reason="Test"
             )
-        }
-        searcher = PlayerSearcher(mock_config, mock_client)
+        })
+        searcher = PlayerSearcher(fake_config, mock_client)
 
         result = searcher.search_player("Colin Ng (G)")
         assert result.found is True
@@ -169,8 +229,7 @@ class TestSearchAlgorithm:
 
     def test_unique_match_first_search(self, searcher, mock_client):
         """Test that unique match on first search returns immediately."""
-        player = make_player(1, "John Doe", 4.0)
-        mock_client.search_players.return_value = [player]
+        mock_client.search_players.return_value = [JOHN_DOE]
 
         result = searcher.search_player("John Doe")
 
@@ -183,7 +242,7 @@ class TestSearchAlgorithm:
     def test_first_name_match_in_results(self, searcher, mock_client):
         """Test matching by first name within multiple results."""
         players = [
-            make_player(1, "John Doe", 4.0),
+            JOHN_DOE,
             make_player(2, "Jane Doe", 3.5),
             make_player(3, "Bob Doe", 3.0)
         ]
@@ -204,7 +263,7 @@ class TestSearchAlgorithm:
             [],  # Full name + Canada
             [],  # Last name + Canada
             [],  # Last name + No filter
-            [make_player(1, "John Doe", 4.0)]  # Full name + No filter
+            [JOHN_DOE]  # Full name + No filter
         ]
 
         result = searcher.search_player("John Doe")
@@ -235,8 +294,7 @@ class TestSearchAlgorithm:
 
     def test_search_with_guest_marker(self, searcher, mock_client):
         """Test that guest marker is cleaned before search."""
-        player = make_player(1, "Colin Ng", 3.5)
-        mock_client.search_players.return_value = [player]
+        mock_client.search_players.return_value = [COLIN_NG]
 
         result = searcher.search_player("Colin Ng (G)")
 
@@ -251,7 +309,7 @@ class TestSearchAlgorithm:
         mock_client.search_players.side_effect = [
             [],  # Full name + Alberta
             [],  # Full name + Canada
-            [make_player(1, "Colin Ng", 3.5)]  # Full name + No filter
+            [COLIN_NG]  # Full name + No filter
         ]
 
         result = searcher.search_player("Colin Ng")
@@ -260,6 +318,70 @@ class TestSearchAlgorithm:
         # Should have only done 3 searches (no last-name-only searches)
         assert mock_client.search_players.call_count == 3
 
+    def test_single_word_name_skips_repeated_queries(self, searcher, mock_client):
+        """Test that a one-word name doesn't repeat its full-name queries as last-name queries."""
+        mock_client.search_players.return_value = []
+
+        result = searcher.search_player("Madonna")
+
+        assert result.found is False
+        # Full Alberta, Full Canada, Full none
+        queries = [c[1]['query'] for c in mock_client.search_players.call_args_list]
+        assert queries == ["Madonna"] * 3
+
+
+class TestSearchCache:
+    """Tests for reusing search results within a session."""
+
+    def test_repeated_name_searches_once(self, searcher, mock_client):
+        """Test that a name differing only by case/guest marker reuses the first search."""
+        mock_client.search_players.return_value = [JOHN_DOE]
+
+        first = searcher.search_player("John Doe")
+        second = searcher.search_player("john doe (G)")
+
+        assert mock_client.search_players.call_count == 1
+        assert second.rating == first.rating
+        assert second.player_id == first.player_id
+        # Each result keeps the name as entered
+        assert second.name == "john doe (G)"
+
+    def test_cache_hit_registers_variant(self, fake_config, mock_client, tmp_path):
+        """Test that a name served from the cache is still added to the registry."""
+        registry = PlayerRegistry(registry_file=str(tmp_path / "registry.json"))
+        searcher = PlayerSearcher(fake_config, mock_client, registry)
+        mock_client.search_players.return_value = [JOHN_DOE]
+
+        searcher.search_player("John Doe")
+        searcher.search_player("john doe (G)")
+
+        assert mock_client.search_players.call_count == 1
+        assert registry.get("john doe (G)").dupr_id == JOHN_DOE.dupr_id
+
+    def test_does_not_cache_not_found_result(self, searcher, mock_client):
+        """Test that a player who wasn't found is searched again."""
+        mock_client.search_players.return_value = []
+
+        searcher.search_player("Unknown Player")
+        calls = mock_client.search_players.call_count
+        result = searcher.search_player("Unknown Player")
+
+        assert mock_client.search_players.call_count == 2 * calls
+        assert result.found is False
+
+    def test_retries_after_api_errors(self, searcher, mock_client):
+        """Test that a miss caused by API errors doesn't stick for the session."""
+        mock_client.search_players.side_effect = DUPRAPIError("Service unavailable")
+
+        first = searcher.search_player("John Doe")
+        mock_client.search_players.side_effect = None
+        mock_client.search_players.return_value = [JOHN_DOE]
+        second = searcher.search_player("John Doe")
+
+        assert first.found is False
+        assert second.found is True
+        assert second.player_id == JOHN_DOE.id
+
 
 class TestFirstNameMatching:
     """Tests for first name matching logic."""
@@ -315,7 +437,7 @@ class TestSearchResultProperties:
         """Test that search method describes the search that found the player."""
         mock_client.search_players.side_effect = [
             [],  # Full name + Alberta fails
-            [make_player(1, "John Doe", 4.0)]  # Last name + Alberta succeeds
+            [JOHN_DOE]  # Last name + Alberta succeeds
         ]
 
         result = searcher.search_player("John Doe")
@@ -325,10 +447,22 @@ class TestSearchResultProperties:
 
     def test_preserves_original_name_in_result(self, searcher, mock_client):
         """Test that original name (with guest marker) is preserved in result."""
-        player = make_player(1, "Colin Ng", 3.5)
-        mock_client.search_players.return_value = [player]
+        mock_client.search_players.return_value = [COLIN_NG]
 
         result = searcher.search_player("Colin Ng (G)")
 
         # The original name should be preserved
         assert result.name == "Colin Ng (G)"
+
+    def test_survives_pickle(self):
+        """Test that a frozen, slotted result can be pickled and restored."""
+        result = SearchResult(
+            name="John Doe",
+            rating=4.0,
+            player_id=12345,
+            profile_url="https://dashboard.dupr.com/dashboard/player/12345",
+            found=True,
+            search_method="Full name + Alberta"
+        )
+
+        assert pickle.loads(pickle.dumps(result)) == result